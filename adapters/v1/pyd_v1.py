@@ -1,9 +1,18 @@
 # adapters/v1/pyd_v1.py
 from __future__ import annotations
+from functools import lru_cache
 from typing import Dict, Any, Tuple, Type
 from pydantic import BaseModel, create_model
 from sqlalchemy.orm import DeclarativeMeta
 
+@lru_cache(maxsize=None)
+def _py_type_for(type_cls: type) -> Any:
+    """python_type for a SQLAlchemy TypeEngine class (v1 types are parameter-free), str if unknown."""
+    try:
+        return type_cls().python_type
+    except Exception:
+        return str
+
 class V1PydanticBuilder:
     """
     Builds simple Pydantic models from SQLAlchemy columns (your current approach).
@@ -12,17 +21,20 @@ class V1PydanticBuilder:
     """
     def build(self, sa_models: Dict[str, DeclarativeMeta], schema: dict) -> Tuple[Dict[str, Type[BaseModel]], Dict[str, Type[BaseModel]]]:
         p_in: Dict[str, Type[BaseModel]] = {}
+        # Tables with identical (ordered) non-PK fields share one built model; later ones get a
+        # thin named subclass, which is cheaper than a full create_model
+        shape_cache: Dict[Tuple[Tuple[str, Any], ...], Type[BaseModel]] = {}
         for name, sa_cls in sa_models.items():
-            fields = {}
-            for col in sa_cls.__table__.columns:
-                if not col.primary_key:
-                    try:
-                        py_t = col.type.python_type
-                    except Exception:
-                        py_t = str
-                    fields[col.name] = (py_t, ...)
-            p_in[name] = create_model(f"{name.capitalize()}In", **fields)
+            columns = sa_cls.__table__.columns
+            shape = tuple((c.name, _py_type_for(type(c.type))) for c in columns if not c.primary_key)
+            model_name = name.capitalize() + "In"
+            cached = shape_cache.get(shape)
+            if cached is None:
+                fields = {col_name: (py_type, ...) for col_name, py_type in shape}
+                p_in[name] = shape_cache[shape] = create_model(model_name, __base__=BaseModel, **fields)
+            else:
+                p_in[name] = type(model_name, (cached,), {"__module__": cached.__module__})
 
-        # For v1, use same models for output
-        p_out = p_in.copy()
+        # For v1, use same models for output (routes only read from the map, no copy needed)
+        p_out = p_in
         return p_in, p_out
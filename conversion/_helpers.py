@@ -0,0 +1,356 @@
+# conversion/_helpers.py
+"""
+Pure helpers for the Draft-07 → Meta converter: JSON-pointer resolution, constraint
+extraction, type mapping/coercion and FK hint normalization. Lookup tables live at
+module level so they are built once per process.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# ================================
+# JSON Pointer helpers / merging
+# ================================
+# Scalar-ish constraints we need for column mapping
+_KEEP = (
+    "type",
+    "format",
+    "maxLength",
+    "minLength",
+    "default",
+    "enum",
+    "x-unique",
+    "x-refTable",
+    "x-refColumn",
+    "x-relationshipName",
+)
+
+
+def _deep_get(doc: dict, pointer: str, pointer_index: Optional[Dict[str, dict]] = None) -> Optional[dict]:
+    if pointer_index is not None:
+        hit = pointer_index.get(pointer)
+        if hit is not None:
+            return hit
+    if not pointer or not pointer.startswith("#/"):
+        return None
+    parts = pointer[2:].split("/")
+    cur: Any = doc
+    for p in parts:
+        if isinstance(cur, dict) and p in cur:
+            cur = cur[p]
+        else:
+            return None
+    if isinstance(cur, dict):
+        return cur
+    return None
+
+
+def _build_pointer_index(doc: dict) -> Dict[str, dict]:
+    """
+    Walk the document once and map every reachable object to its '#/...' pointer,
+    so repeated $ref lookups become a single dict hit. Keys containing '/' are not
+    indexed (the walker in _deep_get can't address them either).
+    """
+    index: Dict[str, dict] = {}
+    stack: List[Tuple[str, dict]] = [("#", doc)] if isinstance(doc, dict) else []
+    while stack:
+        prefix, node = stack.pop()
+        for k, v in node.items():
+            if isinstance(v, dict) and isinstance(k, str) and "/" not in k:
+                ptr = f"{prefix}/{k}"
+                index[ptr] = v
+                stack.append((ptr, v))
+    return index
+
+
+def _merge_allOf(prop: dict) -> dict:
+    """
+    Flatten allOf into one dict (prop's own keys win, later items override earlier).
+    When there is no allOf key the input is returned as-is, so treat the result as read-only.
+    """
+    if "allOf" not in prop:
+        return prop
+    all_of = prop["allOf"]
+    if not all_of:
+        return {k: v for k, v in prop.items() if k != "allOf"}
+    if len(all_of) == 1:
+        item = all_of[0]
+        merged = dict(item) if isinstance(item, dict) else {}
+    else:
+        merged = {}
+        for item in all_of:
+            if isinstance(item, dict):
+                merged.update(item)
+    for k, v in prop.items():
+        if k != "allOf":
+            merged[k] = v
+    return merged
+
+
+def _extract_scalar_constraints(
+    prop: dict,
+    full_doc: dict,
+    cache: Optional[dict] = None,
+    pointer_index: Optional[Dict[str, dict]] = None,
+) -> dict:
+    """
+    Resolve $ref (if it points to a scalar schema) and flatten allOf.
+    Keep only scalar-ish constraints we need for column mapping.
+
+    `cache` is an optional dict scoped to a single conversion run; results are
+    keyed by (id(prop), id(full_doc)) and the prop is pinned alongside the result
+    so its id cannot be reused while the cache is alive. Callers must treat the
+    returned dict as read-only. `pointer_index` (see _build_pointer_index) turns
+    $ref resolution into a flat lookup.
+    """
+    if cache is not None:
+        key = (id(prop), id(full_doc))
+        hit = cache.get(key)
+        if hit is not None:
+            return hit[1]
+        result = _extract_scalar_constraints_uncached(prop, full_doc, pointer_index)
+        cache[key] = (prop, result)
+        return result
+    return _extract_scalar_constraints_uncached(prop, full_doc, pointer_index)
+
+
+def _extract_scalar_constraints_uncached(
+    prop: dict, full_doc: dict, pointer_index: Optional[Dict[str, dict]]
+) -> dict:
+    # Read-only single pass. Precedence matches the old copy/merge approach:
+    # prop > $ref target > allOf items (later items win over earlier ones).
+    ref = prop.get("$ref")
+    ref_dict = _deep_get(full_doc, ref, pointer_index) if isinstance(ref, str) else None
+    if not isinstance(ref_dict, dict):
+        ref_dict = None
+
+    if "allOf" in prop:
+        all_of = prop["allOf"]
+    elif ref_dict is not None and "allOf" in ref_dict:
+        all_of = ref_dict["allOf"]
+    else:
+        all_of = None
+
+    # Flatten allOf (including referenced blocks), highest precedence first
+    all_of_items: List[dict] = []
+    if all_of:
+        for item in reversed(all_of):
+            if isinstance(item, dict) and "$ref" in item:
+                resolved = _deep_get(full_doc, item["$ref"], pointer_index)
+                if isinstance(resolved, dict):
+                    item = resolved
+            if isinstance(item, dict):
+                all_of_items.append(item)
+
+    out: Dict[str, Any] = {}
+    for k in _KEEP:
+        if k in prop:
+            out[k] = prop[k]
+        elif ref_dict is not None and k in ref_dict:
+            out[k] = ref_dict[k]
+        else:
+            for item in all_of_items:
+                if k in item:
+                    out[k] = item[k]
+                    break
+    return out
+
+
+# ================================
+# Mapping helpers
+# ================================
+# Format wins over type; email/string carry a length and are handled inline
+_FMT_MAP: Dict[str, str] = {
+    "uuid": "UUID",
+    "date-time": "TIMESTAMP",
+    "date": "DATE",
+}
+_TYPE_MAP: Dict[str, str] = {
+    "integer": "INTEGER",
+    "number": "FLOAT",
+    "boolean": "BOOLEAN",
+    # Objects / arrays -> store as JSON (unless caller opts to skip)
+    "object": "JSON",
+    "array": "JSON",
+}
+
+
+def _map_type_to_column(constraints: dict) -> tuple[str, Optional[int], str]:
+    """
+    Map JSON-Schema constraints -> meta dataType (+ optional length).
+    Returns (dataType, length, src_repr)
+    """
+    typ = constraints.get("type")
+    fmt = constraints.get("format")
+
+    src_repr = f"type={typ},format={fmt}"  # for logging
+
+    if isinstance(fmt, str):
+        dt = _FMT_MAP.get(fmt)
+        if dt is not None:
+            return dt, None, src_repr
+    if fmt == "email" or typ == "string":
+        max_len = constraints.get("maxLength")
+        return "VARCHAR", int(max_len) if isinstance(max_len, int) else 255, src_repr
+
+    # Primitives; fallback (unknown / unconstrained) -> TEXT
+    return (_TYPE_MAP.get(typ, "TEXT") if isinstance(typ, str) else "TEXT"), None, src_repr
+
+
+# ---- engine type gating / coercion ----
+# NOTE: Your *destination meta* may only allow UUID/VARCHAR/INTEGER/TIMESTAMP.
+# We therefore coerce others in "core" mode so validation passes.
+ENGINE_ALLOWED = frozenset({"UUID", "VARCHAR", "INTEGER", "TIMESTAMP"})
+
+_COERCE: Dict[str, Callable[[Optional[int]], Tuple[str, Optional[int], str]]] = {
+    "DATE":    lambda length: ("TIMESTAMP", length, "coerced DATE → TIMESTAMP"),
+    "FLOAT":   lambda length: ("VARCHAR", 64, "coerced FLOAT/NUMBER → VARCHAR(64)"),
+    "BOOLEAN": lambda length: ("INTEGER", length, "coerced BOOLEAN → INTEGER (store 0/1)"),
+    "JSON":    lambda length: ("VARCHAR", max(length or 2048, 2048), "coerced JSON → VARCHAR(2048)"),
+    "TEXT":    lambda length: ("VARCHAR", max(length or 2048, 2048), "coerced TEXT → VARCHAR(2048)"),
+}
+
+def _coerce_for_engine(dt: str, length: Optional[int]) -> tuple[str, Optional[int], Optional[str]]:
+    """
+    Force data types into the engine's core set when needed.
+    Returns (coerced_type, coerced_length, note)
+    """
+    if dt in ENGINE_ALLOWED:
+        return dt, length, None
+
+    fn = _COERCE.get(dt)
+    if fn is not None:
+        return fn(length)
+
+    # catch-all
+    return "VARCHAR", length or 255, f"coerced {dt} → VARCHAR({length or 255})"
+
+
+def _normalize_default(value: Any) -> Any:
+    if isinstance(value, str) and value.strip().lower() in {"now()", "now"}:
+        return "now"
+    return value
+
+
+def _def_name_from_ref(ref: str) -> Optional[str]:
+    if not isinstance(ref, str):
+        return None
+    prefix = "#/definitions/"
+    if ref.startswith(prefix):
+        return ref[len(prefix):]
+    return None
+
+
+def _derive_relationship_name(col_name: str, ref_table: str) -> str:
+    if col_name.endswith("_id") and len(col_name) > 3:
+        return col_name[:-3]
+    if ref_table.endswith("s") and len(ref_table) > 1:
+        return ref_table[:-1]
+    return ref_table
+
+
+# ================================
+# FK pointer normalization helpers
+# ================================
+_PTR_CLEAN = str.maketrans({".": "/"})
+
+def _parse_ref_pointer(ptr: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    Single pass over the segments of a pointer-ish string ('#/definitions/t/properties/c',
+    't.properties.c', ...). Everything before the first 'definitions' segment is ignored;
+    the first remaining segment is the table and the one after the first 'properties'
+    segment is the column.
+    """
+    if not isinstance(ptr, str):
+        return None, None
+    s = ptr.strip()
+    if not s:
+        return None, None
+    table: Optional[str] = None
+    column: Optional[str] = None
+    seen_definitions = False
+    seen_properties = False
+    want_column = False
+    for seg in s.lstrip("#/").translate(_PTR_CLEAN).split("/"):
+        if not seg:
+            continue
+        if seg == "definitions" and not seen_definitions:
+            # restart: only what follows 'definitions' counts
+            seen_definitions = True
+            table = column = None
+            seen_properties = want_column = False
+            continue
+        if want_column:
+            column = seg
+            want_column = False
+            if seen_definitions:
+                break
+        elif seg == "properties" and not seen_properties:
+            seen_properties = want_column = True
+        if table is None:
+            table = seg
+    return table, column
+
+
+def _normalize_fk_hints(
+    x_ref_table: Optional[str], x_ref_column: Optional[str], raw_ref: Optional[str]
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    note = None
+    fk_table: Optional[str] = None
+    fk_column: Optional[str] = None
+
+    if x_ref_table:
+        t1, c1 = _parse_ref_pointer(x_ref_table)
+        if t1:
+            if t1 != x_ref_table:
+                note = f"normalized x-refTable '{x_ref_table}' → '{t1}'"
+            fk_table = t1
+        else:
+            fk_table = x_ref_table
+
+        if x_ref_column:
+            t2, c2 = _parse_ref_pointer(x_ref_column)
+            if c2:
+                fk_column = c2
+                if x_ref_column != c2:
+                    note = (note + "; " if note else "") + f"normalized x-refColumn '{x_ref_column}' → '{c2}'"
+            else:
+                if any(sep in x_ref_column for sep in ("/", ".", "#")):
+                    fk_column = x_ref_column.split("/")[-1].split(".")[-1]
+                    if x_ref_column != fk_column:
+                        note = (note + "; " if note else "") + f"normalized x-refColumn '{x_ref_column}' → '{fk_column}'"
+                else:
+                    fk_column = x_ref_column
+        elif c1:
+            fk_column = c1
+
+    if fk_table is None and isinstance(raw_ref, str):
+        t3, c3 = _parse_ref_pointer(raw_ref)
+        if t3:
+            fk_table = t3
+            fk_column = c3 or fk_column
+
+    if fk_table and not fk_column:
+        fk_column = "id"
+
+    return fk_table, fk_column, note
+
+
+def _infer_fk_datatype_from_target(
+    full_doc: dict,
+    target_table: str,
+    target_col: str = "id",
+    cache: Optional[dict] = None,
+    pointer_index: Optional[Dict[str, dict]] = None,
+) -> tuple[str, int | None]:
+    defs = (full_doc or {}).get("definitions") or {}
+    tdef = defs.get(target_table) or {}
+    props = tdef.get("properties") or {}
+    col_schema = props.get(target_col)
+    if isinstance(col_schema, dict):
+        constraints = _extract_scalar_constraints(
+            col_schema, full_doc=full_doc, cache=cache, pointer_index=pointer_index
+        )
+        dt, ln, _src = _map_type_to_column(constraints)
+        return dt, ln
+    return "UUID", None
@@ -1,12 +1,59 @@
 # conversion/schema_converter.py
 from __future__ import annotations
 import json
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+import logging
+import os
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+try:  # imported as part of the `conversion` package
+    from ._helpers import (
+        _build_pointer_index,
+        _coerce_for_engine,
+        _def_name_from_ref,
+        _derive_relationship_name,
+        _extract_scalar_constraints,
+        _infer_fk_datatype_from_target,
+        _map_type_to_column,
+        _normalize_default,
+        _normalize_fk_hints,
+    )
+except ImportError:  # run as a script / imported from the conversion directory
+    from _helpers import (  # type: ignore[no-redef]
+        _build_pointer_index,
+        _coerce_for_engine,
+        _def_name_from_ref,
+        _derive_relationship_name,
+        _extract_scalar_constraints,
+        _infer_fk_datatype_from_target,
+        _map_type_to_column,
+        _normalize_default,
+        _normalize_fk_hints,
+    )
+
 
 # ================================
 # Logging / diagnostics
 # ================================
+# Entity-level progress goes to INFO, per-column detail to DEBUG; messages are
+# %-formatted lazily so nothing is built when the level is disabled.
+logger = logging.getLogger("conversion.schema_converter")
+
+
+def _ensure_verbose_output() -> None:
+    """
+    verbose=True used to print(); library callers that never configured logging
+    still get those messages on stdout. Any existing handler (the CLI's
+    basicConfig, or the caller's own setup on this logger or root) wins.
+    """
+    if logger.hasHandlers():
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.DEBUG)
+
 class MsgLog:
     def __init__(self) -> None:
         self.coercions: List[Dict[str, Any]] = []
@@ -48,9 +95,9 @@ class MsgLog:
         def _print_list(title: str, items: List[Dict[str, Any]]) -> None:
             if not items:
                 return
-            print(f"\n[converter] {title}: {len(items)}")
+            logger.info("\n[converter] %s: %d", title, len(items))
             for it in items:
-                print("  - " + json.dumps(it, ensure_ascii=False))
+                logger.info("  - %s", json.dumps(it, ensure_ascii=False))
 
         _print_list("Coercions (type conversions)", self.coercions)
         _print_list("Fallbacks (unresolved value conversions)", self.fallbacks)
@@ -73,284 +120,220 @@ class MsgLog:
 
 
 # ================================
-# JSON Pointer helpers / merging
+# Main conversion
 # ================================
-def _deep_get(doc: dict, pointer: str) -> Optional[dict]:
-    if not pointer or not pointer.startswith("#/"):
-        return None
-    parts = pointer[2:].split("/")
-    cur: Any = doc
-    for p in parts:
-        if isinstance(cur, dict) and p in cur:
-            cur = cur[p]
-        else:
-            return None
-    if isinstance(cur, dict):
-        return cur
-    return None
+def _intern(value: Any) -> Any:
+    """sys.intern for plain str values; anything else is returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
 
 
-def _merge_allOf(prop: dict) -> dict:
-    base = dict(prop)
-    all_of = base.pop("allOf", [])
-    merged = {}
-    for item in all_of:
-        merged.update(item if isinstance(item, dict) else {})
-    merged.update(base)
-    return merged
-
-
-def _extract_scalar_constraints(prop: dict, full_doc: dict) -> dict:
-    """
-    Resolve $ref (if it points to a scalar schema) and flatten allOf.
-    Keep only scalar-ish constraints we need for column mapping.
-    """
-    effective = dict(prop)
-
-    # Inline $ref (merge, but we'll still look at the original $ref outside for FK detection)
-    ref = effective.get("$ref")
-    if isinstance(ref, str):
-        ref_dict = _deep_get(full_doc, ref)
-        if isinstance(ref_dict, dict):
-            tmp = dict(ref_dict)
-            tmp.update({k: v for k, v in effective.items() if k != "$ref"})
-            effective = tmp
-
-    # Flatten allOf (including referenced blocks)
-    if "allOf" in effective:
-        expanded_allof = []
-        for item in effective["allOf"]:
-            if isinstance(item, dict) and "$ref" in item:
-                resolved = _deep_get(full_doc, item["$ref"])
-                if isinstance(resolved, dict):
-                    expanded_allof.append(resolved)
-                else:
-                    expanded_allof.append(item)
-            else:
-                expanded_allof.append(item)
-        eff = dict(effective)
-        eff["allOf"] = expanded_allof
-        effective = _merge_allOf(eff)
-
-    keep = {
-        "type",
-        "format",
-        "maxLength",
-        "minLength",
-        "default",
-        "enum",
-        "x-unique",
-        "x-refTable",
-        "x-refColumn",
-        "x-relationshipName",
-    }
-    return {k: v for k, v in effective.items() if k in keep}
-
-
-# ================================
-# Mapping helpers
-# ================================
-def _map_type_to_column(constraints: dict) -> tuple[str, Optional[int], str]:
-    """
-    Map JSON-Schema constraints -> meta dataType (+ optional length).
-    Returns (dataType, length, src_repr)
-    """
-    typ = constraints.get("type")
-    fmt = constraints.get("format")
-    max_len = constraints.get("maxLength")
-
-    src_repr = f"type={typ},format={fmt}"  # for logging
-
-    # Specific string formats
-    if fmt == "uuid":
-        return "UUID", None, src_repr
-    if fmt == "date-time":
-        return "TIMESTAMP", None, src_repr
-    if fmt == "date":
-        return "DATE", None, src_repr
-    if fmt == "email":
-        return "VARCHAR", int(max_len) if isinstance(max_len, int) else 255, src_repr
-
-    # Primitives
-    if typ == "string":
-        return "VARCHAR", int(max_len) if isinstance(max_len, int) else 255, src_repr
-    if typ == "integer":
-        return "INTEGER", None, src_repr
-    if typ == "number":
-        return "FLOAT", None, src_repr
-    if typ == "boolean":
-        return "BOOLEAN", None, src_repr
-
-    # Objects / arrays -> store as JSON (unless caller opts to skip)
-    if typ in {"object", "array"}:
-        return "JSON", None, src_repr
-
-    # Fallback (unknown / unconstrained) -> TEXT
-    return "TEXT", None, src_repr
-
-
-# ---- engine type gating / coercion ----
-# NOTE: Your *destination meta* may only allow UUID/VARCHAR/INTEGER/TIMESTAMP.
-# We therefore coerce others in "core" mode so validation passes.
-ENGINE_ALLOWED = {"UUID", "VARCHAR", "INTEGER", "TIMESTAMP"}
-
-def _coerce_for_engine(dt: str, length: Optional[int]) -> tuple[str, Optional[int], Optional[str]]:
+def _process_column(
+    table_name: str,
+    col_name: str,
+    prop: dict,
+    *,
+    draft: dict,
+    pk_set: FrozenSet[str],
+    required_set: FrozenSet[str],
+    log: MsgLog,
+    type_mode: str,
+    fk_normalize: bool,
+    map_objects_as_json: bool,
+    log_columns: bool,
+    constraints_cache: dict,
+    fk_target_cache: Dict[Tuple[str, str], Tuple[str, Optional[int]]],
+    pointer_index: Dict[str, dict],
+) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
     """
-    Force data types into the engine's core set when needed.
-    Returns (coerced_type, coerced_length, note)
+    Convert one property into (column meta, FK meta or None).
+    Returns None when the property is intentionally skipped.
     """
-    if dt in ENGINE_ALLOWED:
-        return dt, length, None
-
-    if dt == "DATE":
-        return "TIMESTAMP", length, "coerced DATE → TIMESTAMP"
-    if dt == "FLOAT":
-        return "VARCHAR", 64, "coerced FLOAT/NUMBER → VARCHAR(64)"
-    if dt == "BOOLEAN":
-        return "INTEGER", length, "coerced BOOLEAN → INTEGER (store 0/1)"
-    if dt == "JSON":
-        return "VARCHAR", max(length or 2048, 2048), "coerced JSON → VARCHAR(2048)"
-    if dt == "TEXT":
-        return "VARCHAR", max(length or 2048, 2048), "coerced TEXT → VARCHAR(2048)"
-
-    # catch-all
-    return "VARCHAR", length or 255, f"coerced {dt} → VARCHAR({length or 255})"
-
-
-def _normalize_default(value: Any) -> Any:
-    if isinstance(value, str) and value.strip().lower() in {"now()", "now"}:
-        return "now"
-    return value
+    # If object/array without FK hints and user opted NOT to map as JSON → skip + LOG
+    prop_type = prop.get("type")
+    # explicit `or` chain: three dict probes, no generator set-up per column
+    if (prop_type in {"array", "object"}) and not ("x-refTable" in prop or "x-refColumn" in prop or "$ref" in prop):
+        if not map_objects_as_json:
+            log.add_skipped(table_name, col_name, reason=f"{prop_type} without FK hints (skipped)")
+            if log_columns:
+                logger.debug("    • %s: skipped (%s without FK hints)", col_name, prop_type)
+            return None
+        # else: allow flow to proceed (we’ll map to JSON and log a fallback later)
 
+    # Constraints
+    constraints = _extract_scalar_constraints(
+        prop, full_doc=draft, cache=constraints_cache, pointer_index=pointer_index
+    )
+    src_typ = constraints.get("type")
+    src_fmt = constraints.get("format")
+
+    # FK resolution
+    raw_ref = prop.get("$ref")
+    if fk_normalize:
+        fk_table, fk_column, norm_note = _normalize_fk_hints(
+            constraints.get("x-refTable"),
+            constraints.get("x-refColumn"),
+            raw_ref,
+        )
+    else:
+        fk_table = constraints.get("x-refTable")
+        fk_column = constraints.get("x-refColumn") or None
+        if fk_table is None:
+            ref_def_name = _def_name_from_ref(raw_ref) if isinstance(raw_ref, str) else None
+            if ref_def_name:
+                fk_table = ref_def_name
+                if fk_column is None:
+                    fk_column = "id"
+        norm_note = None
+
+    if norm_note:
+        log.add_normalization(table_name, col_name, norm_note)
+
+    # Names sliced out of $ref / pointer strings are fresh objects per column;
+    # intern them so every FK entry pointing at a parent shares one string.
+    fk_table = _intern(fk_table)
+    fk_column = _intern(fk_column)
+
+    # Type mapping
+    if fk_table:
+        fk_key = (fk_table, fk_column or "id")
+        fk_target = fk_target_cache.get(fk_key)
+        if fk_target is None:
+            fk_target = fk_target_cache[fk_key] = _infer_fk_datatype_from_target(
+                draft, fk_key[0], fk_key[1],
+                cache=constraints_cache, pointer_index=pointer_index,
+            )
+        data_type, length = fk_target
+        if data_type == "UUID" and (src_typ or src_fmt):
+            log.add_fk_fallback(table_name, col_name, fk_table, fk_column or "id", decided="UUID")
+    else:
+        data_type, length, _src_repr = _map_type_to_column(constraints)
+
+        # Fallback cases recorded:
+        if data_type == "TEXT" and src_typ is None and src_fmt is None:
+            log.add_fallback(table_name, col_name, reason="no type/format", decided="TEXT")
+        if data_type == "VARCHAR" and (src_typ == "string") and ("maxLength" not in constraints):
+            log.add_fallback(table_name, col_name, reason="string without maxLength", decided="VARCHAR(255)")
+        if data_type == "JSON" and (src_typ in {"object", "array"}):
+            log.add_fallback(table_name, col_name, reason=f"{src_typ} stored as JSON", decided="JSON")
+
+    # Engine coercion to your *meta* allowed set
+    note = None
+    if type_mode == "core":
+        coerced_type, coerced_len, note = _coerce_for_engine(data_type, length)
+        if note:
+            log.add_coercion(
+                table=table_name,
+                column=col_name,
+                src=(f"{data_type}({length})" if (length and data_type == "VARCHAR") else data_type),
+                dst=(f"{coerced_type}({coerced_len})" if (coerced_len and coerced_type == "VARCHAR") else coerced_type),
+                note=note,
+            )
+        data_type, length = coerced_type, coerced_len
+
+    # Hinted FK but unresolved entirely
+    if (prop.get("$ref") or constraints.get("x-refTable") or constraints.get("x-refColumn")) and not fk_table:
+        log.add_fk_unresolved(
+            table_name,
+            col_name,
+            {"$ref": prop.get("$ref"), "x-refTable": constraints.get("x-refTable"), "x-refColumn": constraints.get("x-refColumn")},
+        )
 
-def _def_name_from_ref(ref: str) -> Optional[str]:
-    if not isinstance(ref, str):
-        return None
-    prefix = "#/definitions/"
-    if ref.startswith(prefix):
-        return ref[len(prefix):]
-    return None
+    # Column meta
+    is_pk = col_name in pk_set
+    not_null = (col_name in required_set) or is_pk
+    is_unique = bool(constraints.get("x-unique", False))
+    default_val_raw = constraints.get("default")
+    default_val = _normalize_default(default_val_raw) if default_val_raw is not None else None
+    if default_val_raw is not None and default_val_raw != default_val:
+        log.add_default_norm(table_name, col_name, original=default_val_raw, normalized=default_val)
+
+    col_meta: Dict[str, Any] = {
+        "columnName": col_name,
+        "dataType": data_type,
+    }
+    if length is not None and data_type == "VARCHAR":
+        col_meta["length"] = length
+    if not not_null:
+        col_meta["isNullable"] = True
+    if is_unique:
+        col_meta["isUnique"] = True
+    if default_val is not None:
+        col_meta["defaultValue"] = default_val
+
+    if log_columns:
+        flags = []
+        if is_pk:
+            flags.append("PK")
+        flags.append("NOT NULL" if not_null else "NULL")
+        if is_unique:
+            flags.append("UNIQUE")
+        if default_val is not None:
+            flags.append(f"DEFAULT={default_val}")
+        lens = f"({length})" if (length is not None and data_type == "VARCHAR") else ""
+        logger.debug(
+            "    • %s: %s%s  [%s]%s",
+            col_name, data_type, lens, ", ".join(flags), f"  [{note}]" if note else "",
+        )
 
+    # FK meta
+    fk_entry: Optional[Dict[str, Any]] = None
+    if fk_table:
+        rel_name = constraints.get("x-relationshipName")
+        rel = rel_name or _intern(_derive_relationship_name(col_name, fk_table))
+        fk_entry = {
+            "columnName": col_name,
+            "referencedTable": fk_table,
+            "referencedColumn": (fk_column or "id"),
+            "relationshipName": rel,
+        }
+        if log_columns:
+            logger.debug("       ↳ FK %s → %s.%s  (rel: %s)", col_name, fk_table, fk_column or "id", rel)
 
-def _derive_relationship_name(col_name: str, ref_table: str) -> str:
-    if col_name.endswith("_id") and len(col_name) > 3:
-        return col_name[:-3]
-    if ref_table.endswith("s") and len(ref_table) > 1:
-        return ref_table[:-1]
-    return ref_table
+    return col_meta, fk_entry
 
 
-# ================================
-# FK pointer normalization helpers
-# ================================
-def _parse_ref_pointer(ptr: str) -> tuple[Optional[str], Optional[str]]:
-    if not isinstance(ptr, str):
-        return None, None
-    s = ptr.strip()
-    if not s:
-        return None, None
-    s = s.lstrip("#/").replace(".", "/")
-    parts = [p for p in s.split("/") if p]
-    if "definitions" in parts:
-        parts = parts[parts.index("definitions") + 1:]
-    table = parts[0] if parts else None
-    column = None
-    if "properties" in parts:
-        i = parts.index("properties")
-        if i + 1 < len(parts):
-            column = parts[i + 1]
-    return table, column
-
-
-def _normalize_fk_hints(
-    x_ref_table: Optional[str], x_ref_column: Optional[str], raw_ref: Optional[str]
-) -> tuple[Optional[str], Optional[str], Optional[str]]:
-    note = None
-    fk_table: Optional[str] = None
-    fk_column: Optional[str] = None
-
-    if x_ref_table:
-        t1, c1 = _parse_ref_pointer(x_ref_table)
-        if t1:
-            if t1 != x_ref_table:
-                note = f"normalized x-refTable '{x_ref_table}' → '{t1}'"
-            fk_table = t1
-        else:
-            fk_table = x_ref_table
-
-        if x_ref_column:
-            t2, c2 = _parse_ref_pointer(x_ref_column)
-            if c2:
-                fk_column = c2
-                if x_ref_column != c2:
-                    note = (note + "; " if note else "") + f"normalized x-refColumn '{x_ref_column}' → '{c2}'"
-            else:
-                if any(sep in x_ref_column for sep in ("/", ".", "#")):
-                    fk_column = x_ref_column.split("/")[-1].split(".")[-1]
-                    if x_ref_column != fk_column:
-                        note = (note + "; " if note else "") + f"normalized x-refColumn '{x_ref_column}' → '{fk_column}'"
-                else:
-                    fk_column = x_ref_column
-        elif c1:
-            fk_column = c1
-
-    if fk_table is None and isinstance(raw_ref, str):
-        t3, c3 = _parse_ref_pointer(raw_ref)
-        if t3:
-            fk_table = t3
-            fk_column = c3 or fk_column
-
-    if fk_table and not fk_column:
-        fk_column = "id"
-
-    return fk_table, fk_column, note
-
-
-def _infer_fk_datatype_from_target(
-    full_doc: dict, target_table: str, target_col: str = "id"
-) -> tuple[str, int | None]:
-    defs = (full_doc or {}).get("definitions") or {}
-    tdef = defs.get(target_table) or {}
-    props = tdef.get("properties") or {}
-    col_schema = props.get(target_col)
-    if isinstance(col_schema, dict):
-        constraints = _extract_scalar_constraints(col_schema, full_doc=full_doc)
-        dt, ln, _src = _map_type_to_column(constraints)
-        return dt, ln
-    return "UUID", None
-
-
-# ================================
-# Main conversion
-# ================================
-def convert_draft7_entities_to_meta(
+def iter_table_metas(
     draft: dict,
-    schema_uri_for_output: str = "schema_definitions/modelSchema.json",
+    log: MsgLog,
     verbose: bool = True,
     type_mode: str = "core",      # 'core' or 'full'
     fk_normalize: bool = False,
-    msglog: Optional[MsgLog] = None,
     map_objects_as_json: bool = True,  # map object/array to JSON or skip+log
-) -> tuple[dict, MsgLog]:
-    log = msglog or MsgLog()
+) -> Iterator[dict]:
+    """
+    Yield one table meta at a time (same order and content as the "tables" list
+    of convert_draft7_entities_to_meta). Diagnostics accumulate in `log`; the
+    summary is left to the caller.
+    """
+    if verbose:
+        _ensure_verbose_output()
     definitions = draft.get("definitions") or {}
-    tables_meta: List[dict] = []
+    # Per-run memo for constraint extraction (never shared across calls)
+    constraints_cache: dict = {}
+    pointer_index = _build_pointer_index(draft)
+    # (target_table, target_column) -> (dataType, length); many FKs point at the same parents
+    fk_target_cache: Dict[Tuple[str, str], Tuple[str, Optional[int]]] = {}
 
     root_props = list((draft.get("properties") or {}).keys())
     defs_keys = list(definitions.keys())
-    ordering = root_props + [k for k in defs_keys if k not in root_props]
+    seen = set(root_props)
+    ordering = root_props + [k for k in defs_keys if k not in seen]
 
-    if verbose:
-        print(
-            f"[schema-converter] Found {len(ordering)} entities "
-            f"(properties-listed: {len(root_props)}, additional: {len(ordering)-len(root_props)})"
+    # Resolve level gates once; the hot loop only tests these booleans
+    log_entities = verbose and logger.isEnabledFor(logging.INFO)
+    log_columns = verbose and logger.isEnabledFor(logging.DEBUG)
+
+    if log_entities:
+        logger.info(
+            "[schema-converter] Found %d entities (properties-listed: %d, additional: %d)",
+            len(ordering), len(root_props), len(ordering) - len(root_props),
         )
 
     for table_name in ordering:
         entity = definitions.get(table_name)
         if not isinstance(entity, dict):
-            if verbose:
-                print(f"  ! Skipping '{table_name}' (not an object schema)")
+            if log_entities:
+                logger.info("  ! Skipping '%s' (not an object schema)", table_name)
             continue
 
         props: dict = entity.get("properties") or {}
@@ -358,148 +341,44 @@ def convert_draft7_entities_to_meta(
         explicit_pk: List[str] = entity.get("x-primaryKey") or entity.get("primaryKey") or []
         inferred_pk: List[str] = ["id"] if not explicit_pk and "id" in props else []
         pk: List[str] = explicit_pk or inferred_pk
+        # O(1) membership for the per-column PK / NOT NULL checks
+        pk_set = frozenset(pk)
+        required_set = frozenset(required)
 
         columns: List[dict] = []
         foreign_keys: List[dict] = []
         fk_count = 0
 
-        if verbose:
+        if log_entities:
             origin = (
                 "explicit x-primaryKey/primaryKey"
                 if explicit_pk
                 else ("inferred ['id']" if inferred_pk else "none")
             )
-            print(f"→ Entity: {table_name}  (PK: {pk if pk else '—'}, source: {origin})")
+            logger.info("→ Entity: %s  (PK: %s, source: %s)", table_name, pk if pk else "—", origin)
 
         for col_name, prop in props.items():
-            # If object/array without FK hints and user opted NOT to map as JSON → skip + LOG
-            prop_type = prop.get("type")
-            if (prop_type in {"array", "object"}) and not any(k in prop for k in ("x-refTable", "x-refColumn", "$ref")):
-                if not map_objects_as_json:
-                    log.add_skipped(table_name, col_name, reason=f"{prop_type} without FK hints (skipped)")
-                    if verbose:
-                        print(f"    • {col_name}: skipped ({prop_type} without FK hints)")
-                    continue
-                # else: allow flow to proceed (we’ll map to JSON and log a fallback later)
-
-            # Constraints
-            constraints = _extract_scalar_constraints(prop, full_doc=draft)
-            src_typ = constraints.get("type")
-            src_fmt = constraints.get("format")
-
-            # FK resolution
-            raw_ref = prop.get("$ref")
-            if fk_normalize:
-                fk_table, fk_column, norm_note = _normalize_fk_hints(
-                    constraints.get("x-refTable"),
-                    constraints.get("x-refColumn"),
-                    raw_ref,
-                )
-            else:
-                fk_table = constraints.get("x-refTable")
-                fk_column = constraints.get("x-refColumn") or None
-                if fk_table is None:
-                    ref_def_name = _def_name_from_ref(raw_ref) if isinstance(raw_ref, str) else None
-                    if ref_def_name:
-                        fk_table = ref_def_name
-                        if fk_column is None:
-                            fk_column = "id"
-                norm_note = None
-
-            if norm_note:
-                log.add_normalization(table_name, col_name, norm_note)
-
-            # Type mapping
-            if fk_table:
-                data_type, length = _infer_fk_datatype_from_target(draft, fk_table, fk_column or "id")
-                if data_type == "UUID" and (src_typ or src_fmt):
-                    log.add_fk_fallback(table_name, col_name, fk_table, fk_column or "id", decided="UUID")
-            else:
-                data_type, length, _src_repr = _map_type_to_column(constraints)
-
-                # Fallback cases recorded:
-                if data_type == "TEXT" and src_typ is None and src_fmt is None:
-                    log.add_fallback(table_name, col_name, reason="no type/format", decided="TEXT")
-                if data_type == "VARCHAR" and (src_typ == "string") and ("maxLength" not in constraints):
-                    log.add_fallback(table_name, col_name, reason="string without maxLength", decided="VARCHAR(255)")
-                if data_type == "JSON" and (src_typ in {"object", "array"}):
-                    log.add_fallback(table_name, col_name, reason=f"{src_typ} stored as JSON", decided="JSON")
-
-            # Engine coercion to your *meta* allowed set
-            note = None
-            if type_mode == "core":
-                coerced_type, coerced_len, note = _coerce_for_engine(data_type, length)
-                if note:
-                    log.add_coercion(
-                        table=table_name,
-                        column=col_name,
-                        src=(f"{data_type}({length})" if (length and data_type == "VARCHAR") else data_type),
-                        dst=(f"{coerced_type}({coerced_len})" if (coerced_len and coerced_type == "VARCHAR") else coerced_type),
-                        note=note,
-                    )
-                data_type, length = coerced_type, coerced_len
-
-            # Hinted FK but unresolved entirely
-            if (prop.get("$ref") or constraints.get("x-refTable") or constraints.get("x-refColumn")) and not fk_table:
-                log.add_fk_unresolved(
-                    table_name,
-                    col_name,
-                    {"$ref": prop.get("$ref"), "x-refTable": constraints.get("x-refTable"), "x-refColumn": constraints.get("x-refColumn")},
-                )
-
-            # Column meta
-            is_pk = col_name in pk
-            not_null = (col_name in required) or is_pk
-            is_unique = bool(constraints.get("x-unique", False))
-            default_val_raw = constraints.get("default")
-            default_val = _normalize_default(default_val_raw) if default_val_raw is not None else None
-            if default_val_raw is not None and default_val_raw != default_val:
-                log.add_default_norm(table_name, col_name, original=default_val_raw, normalized=default_val)
-
-            col_meta: Dict[str, Any] = {
-                "columnName": col_name,
-                "dataType": data_type,
-            }
-            if length is not None and data_type == "VARCHAR":
-                col_meta["length"] = length
-            if not not_null:
-                col_meta["isNullable"] = True
-            if is_unique:
-                col_meta["isUnique"] = True
-            if default_val is not None:
-                col_meta["defaultValue"] = default_val
-
+            processed = _process_column(
+                table_name, col_name, prop,
+                draft=draft,
+                pk_set=pk_set,
+                required_set=required_set,
+                log=log,
+                type_mode=type_mode,
+                fk_normalize=fk_normalize,
+                map_objects_as_json=map_objects_as_json,
+                log_columns=log_columns,
+                constraints_cache=constraints_cache,
+                fk_target_cache=fk_target_cache,
+                pointer_index=pointer_index,
+            )
+            if processed is None:
+                continue
+            col_meta, fk_entry = processed
             columns.append(col_meta)
-
-            if verbose:
-                flags = []
-                if is_pk:
-                    flags.append("PK")
-                flags.append("NOT NULL" if not_null else "NULL")
-                if is_unique:
-                    flags.append("UNIQUE")
-                if default_val is not None:
-                    flags.append(f"DEFAULT={default_val}")
-                lens = f"({length})" if (length is not None and data_type == "VARCHAR") else ""
-                msg = f"    • {col_name}: {data_type}{lens}  [{', '.join(flags)}]"
-                if note:
-                    msg += f"  [{note}]"
-                print(msg)
-
-            # FK meta
-            if fk_table:
-                rel_name = constraints.get("x-relationshipName")
-                rel = rel_name or _derive_relationship_name(col_name, fk_table)
-                fk_entry: Dict[str, Any] = {
-                    "columnName": col_name,
-                    "referencedTable": fk_table,
-                    "referencedColumn": (fk_column or "id"),
-                    "relationshipName": rel,
-                }
+            if fk_entry is not None:
                 foreign_keys.append(fk_entry)
                 fk_count += 1
-                if verbose:
-                    print(f"       ↳ FK {col_name} → {fk_table}.{fk_column or 'id'}  (rel: {rel})")
 
         table_meta: Dict[str, Any] = {
             "tableName": table_name,
@@ -510,17 +389,54 @@ def convert_draft7_entities_to_meta(
         if foreign_keys:
             table_meta["foreignKeys"] = foreign_keys
 
-        if verbose:
-            print(f"   summary: {len(columns)} columns, {fk_count} foreign keys\n")
+        if log_entities:
+            logger.info("   summary: %d columns, %d foreign keys\n", len(columns), fk_count)
 
-        tables_meta.append(table_meta)
+        yield table_meta
 
-    if verbose:
+
+def convert_draft7_entities_to_meta(
+    draft: dict,
+    schema_uri_for_output: str = "schema_definitions/modelSchema.json",
+    verbose: bool = True,
+    type_mode: str = "core",      # 'core' or 'full'
+    fk_normalize: bool = False,
+    msglog: Optional[MsgLog] = None,
+    map_objects_as_json: bool = True,  # map object/array to JSON or skip+log
+) -> tuple[dict, MsgLog]:
+    log = msglog or MsgLog()
+    tables_meta = list(iter_table_metas(
+        draft,
+        log,
+        verbose=verbose,
+        type_mode=type_mode,
+        fk_normalize=fk_normalize,
+        map_objects_as_json=map_objects_as_json,
+    ))
+
+    if verbose and logger.isEnabledFor(logging.INFO):
         log.print_summary()
 
     return {"$schema": schema_uri_for_output, "tables": tables_meta}, log
 
 
+def write_meta_json(fp: TextIO, schema_uri_for_output: str, tables: Iterable[dict]) -> None:
+    """
+    Write {"$schema": ..., "tables": [...]} to `fp` one table at a time.
+    Output is byte-identical to json.dump(meta, fp, indent=2), but the converted
+    tables are never collected into one list (the input draft and its pointer
+    index are still held in full).
+    """
+    fp.write('{\n  "$schema": ' + json.dumps(schema_uri_for_output) + ',\n  "tables": [')
+    first = True
+    for table in tables:
+        fp.write("\n    " if first else ",\n    ")
+        # JSON strings never contain raw newlines, so re-indenting line-wise is safe
+        fp.write(json.dumps(table, indent=2).replace("\n", "\n    "))
+        first = False
+    fp.write("]\n}" if first else "\n  ]\n}")
+
+
 # ================================
 # CLI
 # ================================
@@ -556,19 +472,44 @@ if __name__ == "__main__":
     ap.add_argument("--log", help="Write structured diagnostics JSON to this path (optional)")
     args = ap.parse_args()
 
-    src = json.loads(Path(args.input).read_text(encoding="utf-8"))
-    meta, msglog = convert_draft7_entities_to_meta(
-        src,
-        schema_uri_for_output=args.schema_uri,
-        verbose=not args.quiet,
-        type_mode=args.types,
-        fk_normalize=args.fk_normalize,
-        map_objects_as_json=args.map_objects_as_json,
+    # Plain messages on stdout, as before; --quiet silences the per-entity/field chatter
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.DEBUG,
+        format="%(message)s",
+        stream=sys.stdout,
     )
-    Path(args.output).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    with open(args.input, encoding="utf-8") as f:
+        src = json.load(f)
+    msglog = MsgLog()
+    # Tables are converted and written one by one into a temp file next to the output, which
+    # only replaces it once conversion succeeded (engine.main loads this file at startup)
+    tmp = f"{args.output}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            write_meta_json(
+                f,
+                args.schema_uri,
+                iter_table_metas(
+                    src,
+                    msglog,
+                    verbose=not args.quiet,
+                    type_mode=args.types,
+                    fk_normalize=args.fk_normalize,
+                    map_objects_as_json=args.map_objects_as_json,
+                ),
+            )
+        os.replace(tmp, args.output)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    if not args.quiet:
+        msglog.print_summary()
     print(f"Wrote {args.output}")
 
     if args.log:
-        Path(args.log).write_text(json.dumps(msglog.to_json(), indent=2), encoding="utf-8")
+        with open(args.log, "w", encoding="utf-8") as f:
+            json.dump(msglog.to_json(), f, indent=2)
         if not args.quiet:
             print(f"Wrote diagnostics log to {args.log}")
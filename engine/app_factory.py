@@ -1,13 +1,20 @@
 # engine/app_factory.py
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from fastapi import FastAPI
 from typing import Dict, Any
 
-from engine.db import engine
+from engine.db import get_engine
 from engine.routes import router, setup_routes
 from core.ports import SchemaLoader, ModelBuilder, PydanticBuilder
 
+@lru_cache(maxsize=None)
+def _ensure_schema(metadata) -> None:
+    """create_all once per MetaData object per process (MetaData hashes by identity)."""
+    metadata.create_all(bind=get_engine())
+
 def create_app(schema_loader: SchemaLoader, model_builder: ModelBuilder, pyd_builder: PydanticBuilder) -> FastAPI:
     app = FastAPI(title="Schema Backend Engine (modular)", version="1.0.0")
 
@@ -17,8 +24,9 @@ def create_app(schema_loader: SchemaLoader, model_builder: ModelBuilder, pyd_bui
     # 2) Build SQLAlchemy models from schema
     sa_models = model_builder.build(schema)
 
-    # 3) Create DB tables
-    model_builder.Base.metadata.create_all(bind=engine)
+    # 3) Create DB tables (once per process; AUTO_CREATE_TABLES=0 leaves DDL to the deployer)
+    if os.getenv("AUTO_CREATE_TABLES", "1") == "1":
+        _ensure_schema(model_builder.Base.metadata)
 
     # 4) Build Pydantic input/output models
     pyd_in, pyd_out = pyd_builder.build(sa_models, schema)
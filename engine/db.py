@@ -1,10 +1,12 @@
 from __future__ import annotations
 import os
 from functools import lru_cache
-from typing import Generator
+from typing import Any, Dict, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -23,14 +25,49 @@ class Settings:
 def get_settings() -> Settings:
     return Settings()
 
-_settings = get_settings()
+def _engine_kwargs(database_url: str) -> Dict[str, Any]:
+    """
+    Dialect-aware pool settings:
+      - sqlite: no pre-ping (local file), allow use from FastAPI's threadpool;
+                in-memory DBs share one connection (StaticPool) or each checkout sees an empty DB
+      - others: recycle connections before server-side idle timeouts; pool size via DB_POOL_SIZE,
+                burst capacity via DB_MAX_OVERFLOW (sync handlers run in FastAPI's threadpool, so
+                size + overflow bounds how many requests can hold a connection at once)
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        kwargs: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+        if url.database in (None, "", ":memory:"):
+            kwargs["poolclass"] = StaticPool
+        return kwargs
+    return {
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    }
 
-# echo can be toggled via LOG_LEVEL if you like
-engine = create_engine(_settings.DATABASE_URL, pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+@lru_cache
+def get_engine() -> Engine:
+    """Create the engine on first use so importing this module never opens a pool."""
+    database_url = get_settings().DATABASE_URL
+    # echo can be toggled via LOG_LEVEL if you like
+    return create_engine(database_url, future=True, **_engine_kwargs(database_url))
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker:
+    return sessionmaker(bind=get_engine(), autocommit=False, autoflush=False, future=True)
+
+def __getattr__(name: str) -> Any:
+    # Keep `from engine.db import engine, SessionLocal` working, resolved lazily (PEP 562)
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_db() -> Generator:
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import Session, declarative_base
-from engine.db import engine
+from engine.db import get_engine
 import logging
 
 # Set up logging
@@ -15,25 +15,26 @@ except ImportError as e:
     raise
 
 def initialize_database():
+    engine = get_engine()
     logger.info(f"Initializing database with engine: {engine}")
     try:
-        with engine.connect() as connection:
+        # One connection for the whole bootstrap; create_all(checkfirst=True) does its own
+        # existence checks on it, so only the "before" listing needs an explicit reflection.
+        with engine.begin() as connection:
             logger.info("Checking existing tables...")
-            inspector = inspect(engine)
-            existing_tables = inspector.get_table_names()
+            existing_tables = inspect(connection).get_table_names()
             logger.info(f"Existing tables: {existing_tables}")
-        Base.metadata.create_all(bind=engine)
-        with engine.connect() as connection:
-            logger.info("Verifying tables after creation...")
-            inspector = inspect(engine)
-            created_tables = inspector.get_table_names()
-            logger.info(f"Tables after creation: {created_tables}")
+            Base.metadata.create_all(bind=connection, checkfirst=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Verifying tables after creation...")
+                created_tables = inspect(connection).get_table_names()
+                logger.debug(f"Tables after creation: {created_tables}")
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
         raise
 
 def get_db_session():
-    db = Session(bind=engine)
+    db = Session(bind=get_engine())
     try:
         yield db
     finally:
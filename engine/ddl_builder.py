@@ -1,6 +1,7 @@
 # engine/ddl_builder.py
 from __future__ import annotations
-from typing import Dict, Any, Tuple, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Tuple, Optional, List, Set
 from sqlalchemy import Column, ForeignKey, func
 from sqlalchemy.orm import DeclarativeBase
 from engine.meta_models import ModelMeta, Table, Column as MetaCol
@@ -9,6 +10,17 @@ from engine.type_mapping import sqlalchemy_type
 class Base(DeclarativeBase):
     pass
 
+_NOW_TOKENS = frozenset({"now", "now()", "current_timestamp", "current_timestamp()"})
+
+@lru_cache(maxsize=32)
+def _is_now_token(val: str) -> bool:
+    # Few distinct default strings per schema, so memoize the strip/lower per spelling
+    return val.strip().lower() in _NOW_TOKENS
+
+def _is_now(val: object) -> bool:
+    """Normalize common timestamp/date "now" spellings (only strings can be, and are hashable)."""
+    return isinstance(val, str) and _is_now_token(val)
+
 def _default_kwargs(meta_col: MetaCol, data_type: str) -> dict:
     kwargs = {
         "nullable": bool(meta_col.isNullable) if meta_col.isNullable is not None else False,
@@ -16,55 +28,70 @@ def _default_kwargs(meta_col: MetaCol, data_type: str) -> dict:
     }
 
     dv = meta_col.defaultValue
-
-    # Normalize common timestamp/date "now" spellings
-    def _is_now(val: object) -> bool:
-        if not isinstance(val, str):
-            return False
-        v = val.strip().lower()
-        return v in {"now", "now()", "current_timestamp", "current_timestamp()"}
+    if dv is None:  # the common case
+        return kwargs
 
     if _is_now(dv):
-        if data_type.upper() == "TIMESTAMP":
+        dt = data_type.upper()
+        if dt == "TIMESTAMP":
             kwargs["server_default"] = func.now()
-        elif data_type.upper() == "DATE":
+        elif dt == "DATE":
             kwargs["server_default"] = func.current_date()
-    elif dv is not None:
+    else:
         # For literal defaults, use SQLAlchemy's client-side default
         kwargs["default"] = dv
 
     return kwargs
 
+def _build_fk_index(tables: List[Table]) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """{(tableName, columnName): (referencedTable, referencedColumn)} for every FK, built in one pass."""
+    return {
+        (t.tableName, fk.columnName): (fk.referencedTable, fk.referencedColumn)
+        for t in tables
+        for fk in (t.foreignKeys or [])
+    }
+
 def _build_columns_for_table(
     table_meta: Table,
-    dialect: str
+    dialect: str,
+    type_cache: Optional[Dict[Tuple[Any, ...], Any]] = None,
+    fk_lookup: Optional[Dict[Tuple[str, str], Tuple[str, str]]] = None,
 ) -> Tuple[Dict[str, Any], List[Tuple[str, str, str]]]:
     """
     Returns (attrs, fks)
     attrs: dict of class attributes to set (Columns)
     fks: list of tuples (col_name, ref_table, ref_col)
+    type_cache: optional {(dataType, length, precision, scale): SQLAlchemy type}, shared across
+                tables so identical column shapes reuse one type instance
+    fk_lookup: optional meta-wide {(tableName, columnName): (ref_table, ref_col)} from
+               _build_fk_index; built for this table alone when omitted
     """
+    if type_cache is None:
+        type_cache = {}
+    if fk_lookup is None:
+        fk_lookup = _build_fk_index([table_meta])
     attrs: Dict[str, Any] = {"__tablename__": table_meta.tableName}
     primary_keys = set(table_meta.primaryKey or [])
     fk_tuples: List[Tuple[str, str, str]] = []
 
-    # Index foreign keys by column for quick lookup
-    fk_map = {}
-    for fk in (table_meta.foreignKeys or []):
-        fk_map[fk.columnName] = (fk.referencedTable, fk.referencedColumn)
+    table_name = table_meta.tableName
 
     for col in table_meta.columns:
-        sa_type = sqlalchemy_type(
-            col.dataType.value if hasattr(col.dataType, "value") else str(col.dataType),
-            length=col.length,
-            precision=col.precision,
-            scale=col.scale,
-            dialect=dialect,
-        )
+        dtype_str = col.dataType.value if hasattr(col.dataType, "value") else str(col.dataType)
+        type_key = (dtype_str, col.length, col.precision, col.scale)
+        sa_type = type_cache.get(type_key)
+        if sa_type is None:
+            sa_type = type_cache[type_key] = sqlalchemy_type(
+                dtype_str,
+                length=col.length,
+                precision=col.precision,
+                scale=col.scale,
+                dialect=dialect,
+            )
         is_pk = col.columnName in primary_keys
-        fk_ref = fk_map.get(col.columnName)
+        fk_ref = fk_lookup.get((table_name, col.columnName))
 
-        kwargs = _default_kwargs(col, col.dataType.value if hasattr(col.dataType, "value") else str(col.dataType))
+        kwargs = _default_kwargs(col, dtype_str)
 
         if fk_ref:
             ref_table, ref_col = fk_ref
@@ -94,14 +121,36 @@ def build_models_from_meta(meta: ModelMeta, dialect: str = "generic") -> Dict[st
     Returns {tableName: ModelClass}
     """
     models: Dict[str, type] = {}
+    type_cache: Dict[Tuple[Any, ...], Any] = {}  # one type instance per column shape (dialect is fixed here)
+    fk_lookup = _build_fk_index(meta.tables)
     for table in meta.tables:
-        attrs, _ = _build_columns_for_table(table, dialect=dialect)
+        attrs, _ = _build_columns_for_table(
+            table, dialect=dialect, type_cache=type_cache, fk_lookup=fk_lookup
+        )
         cls_name = "".join(part.capitalize() for part in table.tableName.split("_"))
         model_cls = type(cls_name, (Base,), attrs)
         models[table.tableName] = model_cls
+    # Configure all new mappers in one pass now that every class exists, rather than
+    # lazily on first query / per class; mapping errors also surface at startup
+    Base.registry.configure()
     return models
 
-def create_all_from_meta(engine, meta: ModelMeta, dialect: str = "generic") -> Dict[str, type]:
+def create_all_from_meta(
+    engine,
+    meta: ModelMeta,
+    dialect: str = "generic",
+    existing_tables: Optional[Set[str]] = None,
+) -> Dict[str, type]:
+    """
+    Build the models and create their tables (creates only).
+    existing_tables: table names already reflected from the DB; those are skipped without
+                     a per-table existence check (only the rest go through checkfirst).
+    """
     models = build_models_from_meta(meta, dialect=dialect)
-    Base.metadata.create_all(bind=engine)
+    if existing_tables is None:
+        Base.metadata.create_all(bind=engine)
+    else:
+        to_create = [t for t in Base.metadata.sorted_tables if t.name not in existing_tables]
+        if to_create:
+            Base.metadata.create_all(bind=engine, tables=to_create)
     return models
@@ -5,28 +5,33 @@ import sys
 def generate_ddl(model):
     ddl = []
     for table in model["tables"]:
+        pk = table.get("primaryKey") or []
+        pk_set = set(pk)
+        # Index FKs by column once instead of rescanning them for every column
+        fks_by_col = {}
+        for fk in table.get("foreignKeys", []):
+            fks_by_col.setdefault(fk["columnName"], []).append(fk)
+
         columns = []
+        inline_pk = False
         for col in table["columns"]:
-            col_def = f"{col['columnName']} {col['dataType']}"
-            if col.get("length"):
-                col_def += f"({col['length']})"
-            if table.get("primaryKey") and col["columnName"] in table["primaryKey"]:
-                col_def += " PRIMARY KEY"
+            type_sql = f"{col['dataType']}({col['length']})" if col.get("length") else f"{col['dataType']}"
+            parts = [f"{col['columnName']}", type_sql]
+            if col["columnName"] in pk_set:
+                parts.append("PRIMARY KEY")
+                inline_pk = True
             if col.get("isUnique", False):
-                col_def += " UNIQUE"
+                parts.append("UNIQUE")
             if not col.get("isNullable", True):
-                col_def += " NOT NULL"
+                parts.append("NOT NULL")
             if "defaultValue" in col:
-                col_def += f" DEFAULT {col['defaultValue']}"
-            for fk in table.get("foreignKeys", []):
-                if fk["columnName"] == col["columnName"]:
-                    col_def += f" REFERENCES {fk['referencedTable']}({fk['referencedColumn']})"
-            columns.append(col_def)
-        table_def = f"CREATE TABLE {table['tableName']} (\n  {', '.join(columns)}"
-        if table.get("primaryKey") and not any(col["columnName"] in table["primaryKey"] for col in table["columns"]):
-            table_def += f",\n  PRIMARY KEY ({', '.join(table['primaryKey'])})"
-        table_def += "\n);"
-        ddl.append(table_def)
+                parts.append(f"DEFAULT {col['defaultValue']}")
+            for fk in fks_by_col.get(col["columnName"], ()):
+                parts.append(f"REFERENCES {fk['referencedTable']}({fk['referencedColumn']})")
+            columns.append(" ".join(parts))
+
+        pk_clause = f",\n  PRIMARY KEY ({', '.join(pk)})" if pk and not inline_pk else ""
+        ddl.append(f"CREATE TABLE {table['tableName']} (\n  {', '.join(columns)}{pk_clause}\n);")
     return "\n".join(ddl)
 
 def main():
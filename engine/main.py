@@ -1,20 +1,21 @@
 # engine/main.py
 from __future__ import annotations
 import os
+import json
 import logging
 import hashlib
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.routing import APIRoute
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text, inspect
 
 from engine.db import engine, get_settings
-from engine.meta_models import ModelMeta
+from engine.meta_models import DataType
+from engine.meta_fast import AnyMeta, decode_meta, meta_to_builtins, new_column
 from engine.ddl_builder import create_all_from_meta
 from engine.routes import build_crud_router
-from engine.migrate_additive import plan_and_apply_additive  # safety-gated below
 from engine.schema_guard import diff_schema  # NEW
 
 settings = get_settings()
@@ -43,81 +44,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def _sanitize_meta(meta: ModelMeta) -> ModelMeta:
+def _sanitize_meta(meta: AnyMeta) -> AnyMeta:
     """
     Fix common authoring artifacts:
       - FK referencedTable like 'process_definition/properties/id' -> 'process_definition'
       - FK referencedColumn missing or pointer-like -> 'id'
       - Ensure form_definition.field_state_setting exists as JSON
-    Returns a new validated ModelMeta.
+    Mutates the already-validated meta in place (no dump/re-validate round-trip) and returns it.
     """
-    d = meta.model_dump(mode="json")
     fk_fixes = 0
     fk_defaulted = 0
     field_state_setting_added = False
 
-    for t in d.get("tables", []):
+    for t in meta.tables:
         # Ensure form_definition.field_state_setting
-        if t.get("tableName") == "form_definition":
-            cols = t.get("columns", [])
-            if not any(c.get("columnName") == "field_state_setting" for c in cols):
-                cols.append({
-                    "columnName": "field_state_setting",
-                    "dataType": "JSON",
-                    "isNullable": False
-                })
-                t["columns"] = cols
+        if t.tableName == "form_definition":
+            if not any(c.columnName == "field_state_setting" for c in t.columns):
+                t.columns.append(new_column(
+                    meta,
+                    columnName="field_state_setting",
+                    dataType=DataType.JSON,
+                    isNullable=False,
+                ))
                 field_state_setting_added = True
 
         # Normalize FK targets
-        for fk in (t.get("foreignKeys") or []):
-            rt = fk.get("referencedTable")
+        for fk in (t.foreignKeys or []):
+            # partition/rpartition allocate one 3-tuple instead of a list per split
+            rt = fk.referencedTable
             if isinstance(rt, str):
-                new_rt = rt.lstrip("#/").split("/")[0]
+                new_rt = rt.lstrip("#/").partition("/")[0]
                 if new_rt != rt:
-                    fk["referencedTable"] = new_rt
+                    fk.referencedTable = new_rt
                     fk_fixes += 1
 
-            rc = fk.get("referencedColumn")
+            rc = fk.referencedColumn
             if isinstance(rc, str) and rc:
-                new_rc = rc.split("/")[-1].split(".")[-1]
+                new_rc = rc.rpartition("/")[2].rpartition(".")[2]
                 if new_rc != rc:
-                    fk["referencedColumn"] = new_rc
                     fk_fixes += 1
-
-            if not fk.get("referencedColumn"):
-                fk["referencedColumn"] = "id"
+                rc = new_rc
+            if not rc:
+                rc = "id"
                 fk_defaulted += 1
+            if rc != fk.referencedColumn:
+                fk.referencedColumn = rc
 
-    meta_fixed = ModelMeta.model_validate(d)
     logger.info(
         "Sanitized meta: fk_fixes=%s fk_defaultedColumn=%s field_state_setting_added=%s",
         fk_fixes, fk_defaulted, field_state_setting_added
     )
-    return meta_fixed
+    return meta
 
 # ---- Load meta (path overridable) ----
 META_PATH = os.getenv("MODEL_META_PATH", "schema/schema.meta.json")
 try:
     meta_path = Path(META_PATH).resolve()
-    raw = meta_path.read_text(encoding="utf-8")
-    meta = ModelMeta.model_validate_json(raw)
-    logger.info("Loaded meta from %s with %d tables", str(meta_path), len(meta.tables))
+    raw_bytes = meta_path.read_bytes()  # read once: hashed for the ACK, then decoded
 except Exception as e:
-    logger.error("Failed to load/validate meta at %s: %s", META_PATH, e)
+    logger.error("Failed to read meta at %s: %s", META_PATH, e)
     raise
 
-# Compute a content hash of the meta (used for apply ACK)
+# Compute a content hash of the meta (used for apply ACK).
+# Stays SHA256: the ACK is documented as its first 8 hex chars, and hashlib's
+# OpenSSL backend already uses SHA-NI / ARMv8 crypto instructions where present.
+meta_sha256 = hashlib.sha256(raw_bytes).hexdigest()
+meta_ack_hint = meta_sha256[:8]
+
 try:
-    meta_sha256 = hashlib.sha256(meta_path.read_bytes()).hexdigest()
-    meta_ack_hint = meta_sha256[:8]
-except Exception:
-    meta_sha256 = "-"
-    meta_ack_hint = "-"
+    meta = decode_meta(raw_bytes)  # msgspec fast path; Pydantic if msgspec is missing
+    logger.info("Loaded meta from %s with %d tables", str(meta_path), len(meta.tables))
+except Exception as e:
+    logger.error("Failed to load/validate meta at %s: %s", META_PATH, e)
+    raise
+del raw_bytes
 
 # Capture DB state *before* any create_all() to detect pre-existing schemas
 insp_before = inspect(engine)
-had_existing_tables = bool(insp_before.get_table_names())
+existing_tables = set(insp_before.get_table_names())
+had_existing_tables = bool(existing_tables)
 
 # Optional: drop & recreate for dev only (dangerous)
 if os.getenv("ENGINE_RECREATE") == "1":
@@ -134,7 +139,11 @@ meta = _sanitize_meta(meta)
 
 # ---- Build models + create tables (idempotent; creates only) ----
 try:
-    models = create_all_from_meta(engine, meta, dialect=settings.DIALECT)
+    models = create_all_from_meta(
+        engine, meta, dialect=settings.DIALECT,
+        # ENGINE_RECREATE may have dropped tables since the snapshot, so let create_all check them all
+        existing_tables=None if os.getenv("ENGINE_RECREATE") == "1" else existing_tables,
+    )
     logger.info("SQLAlchemy models created for: %s", ", ".join(models.keys()))
 except Exception as e:
     logger.error("DDL/model creation failed: %s", e)
@@ -159,7 +168,7 @@ is_sqlite = url.get_backend_name().startswith("sqlite")
 is_remote_host = (not is_sqlite) and (url.host not in (None, "localhost", "127.0.0.1"))
 
 # Compute diff between DB and Meta (additive-only)
-diff = diff_schema(engine, meta)
+diff = diff_schema(engine, meta, inspector=insp_before)
 
 if plan_flag:
     plan_text = diff.format_plan()
@@ -207,10 +216,11 @@ if apply_flag:
         "APPLYING additive changes (env-acknowledged). Meta ack=%s, remote=%s, preexisting=%s",
         ack_value, is_remote_host, had_existing_tables
     )
-    plan_and_apply_additive(engine, meta, dialect=settings.DIALECT, apply=True)
+    from engine.migrate_additive import plan_and_apply_additive  # only needed on the (rare) apply path
+    plan_and_apply_additive(engine, meta, dialect=settings.DIALECT, apply=True, inspector=insp_before)
 
     # Re-check after apply
-    diff2 = diff_schema(engine, meta)
+    diff2 = diff_schema(engine, meta, inspector=insp_before)
     if diff2.has_changes:
         raise SystemExit("After APPLY, differences remain:\n" + diff2.format_plan())
     logger.info("Additive migration complete; schema matches meta.")
@@ -218,18 +228,32 @@ if apply_flag:
 
 
 # ---- Register CRUD routers (single-PK only) ----
+# Splice every entity's routes into one router and include it once (one app-level merge
+# instead of one per table); routes already carry their prefix and tags.
+crud_router = APIRouter()
 for t in meta.tables:
     m = models.get(t.tableName)
     if not m:
         continue
     if t.primaryKey and len(t.primaryKey) == 1:
-        app.include_router(build_crud_router(t, m, meta))
+        crud_router.routes.extend(build_crud_router(t, m, meta).routes)
     else:
         logger.warning("Skipping router for %s (PK not single-column)", t.tableName)
+app.include_router(crud_router)
+
+# The meta is read-only after startup: serialize /meta once (same encoding as JSONResponse)
+_META_JSON = json.dumps(
+    meta_to_builtins(meta), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+).encode("utf-8")
+_META_ETAG = '"%s"' % hashlib.sha256(_META_JSON).hexdigest()[:32]
 
 @app.get("/meta")
-def get_meta():
-    return meta.model_dump(mode="json")
+def get_meta(request: Request):
+    headers = {"ETag": _META_ETAG}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _META_ETAG in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_META_JSON, media_type="application/json", headers=headers)
 
 @app.get("/entities")
 def list_entities():
@@ -0,0 +1,78 @@
+# engine/meta_fast.py
+"""
+msgspec mirrors of engine.meta_models for fast meta decoding at startup.
+
+The meta is a machine-emitted IR, so decoding it straight into msgspec Structs
+(typed + validated in one C pass) is much cheaper than a full Pydantic model
+tree. msgspec is optional: without it every helper here falls back to the
+Pydantic ModelMeta. Both representations expose the same attributes
+(meta.tables[i].columns[j].dataType, ...), so ddl_builder, routes and the
+migration helpers work with either.
+"""
+from __future__ import annotations
+from typing import Any, List, Optional, Union
+
+from engine.meta_models import Column, DataType, ModelMeta
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+if msgspec is not None:
+    class ColumnFast(msgspec.Struct):
+        columnName: str
+        dataType: DataType
+        length: Optional[int] = None
+        precision: Optional[int] = None
+        scale: Optional[int] = None
+        isNullable: Optional[bool] = None
+        isUnique: Optional[bool] = None
+        defaultValue: Optional[Any] = None
+
+    class ForeignKeyFast(msgspec.Struct):
+        columnName: str
+        referencedTable: str
+        referencedColumn: str
+        relationshipName: Optional[str] = None
+
+    class IndexFast(msgspec.Struct):
+        name: str
+        columns: List[str]
+        unique: Optional[bool] = None
+
+    class TableFast(msgspec.Struct):
+        tableName: str
+        columns: List[ColumnFast]
+        primaryKey: Optional[List[str]] = None
+        foreignKeys: Optional[List[ForeignKeyFast]] = None
+        indexes: Optional[List[IndexFast]] = None
+
+    class ModelMetaFast(msgspec.Struct):
+        tables: List[TableFast]
+
+    AnyMeta = Union[ModelMeta, ModelMetaFast]
+else:
+    AnyMeta = ModelMeta  # type: ignore[misc]
+
+
+def decode_meta(raw: Union[str, bytes]) -> AnyMeta:
+    """Decode + validate meta JSON. Lax (strict=False) to match Pydantic's coercions."""
+    if msgspec is not None:
+        return msgspec.json.decode(raw, type=ModelMetaFast, strict=False)
+    return ModelMeta.model_validate_json(raw)
+
+
+def new_column(meta: AnyMeta, **fields: Any) -> Any:
+    """Build a column of the same representation as `meta` (for in-place additions)."""
+    if isinstance(meta, ModelMeta):
+        return Column(**fields)
+    return ColumnFast(**fields)
+
+
+def meta_to_builtins(meta: AnyMeta) -> dict:
+    """JSON-ready dict; same shape as ModelMeta.model_dump(mode="json")."""
+    if isinstance(meta, ModelMeta):
+        return meta.model_dump(mode="json")
+    return msgspec.to_builtins(meta)
@@ -2,125 +2,174 @@
 from __future__ import annotations
 import logging
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set
 
 from sqlalchemy import inspect
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, Inspector
+
+from engine.meta_models import DataType
 
 logger = logging.getLogger(__name__)
 
 # ---- small plan model --------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AddColumn:
     table: str
     column: str
     type_sql: str  # raw SQL type
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AddFK:
     table: str
     column: str
     ref_table: str
     ref_column: str
 
-@dataclass
+@dataclass(slots=True)
 class Plan:
     add_columns: List[AddColumn]
     add_fks: List[AddFK]
 
 # ---- helpers ----------------------------------------------------------------
 
+# DataType -> plain str in one dict lookup (the str-Enum hashes like its value, so a
+# bare "VARCHAR" finds its entry too)
+_DT: Dict[str, str] = {dt: dt.value for dt in DataType}
+
+# Simple, conservative mapping that works across sqlite/pg; unknown types fall back to TEXT
+_STATIC_SQL_TYPES: Dict[str, str] = {
+    "TEXT": "TEXT",
+    "INTEGER": "INTEGER",
+    "BIGINT": "BIGINT",
+    "FLOAT": "FLOAT",
+    "BOOLEAN": "BOOLEAN",
+    "DATE": "DATE",
+    "TIMESTAMP": "TIMESTAMP",  # keep generic; engines will map it
+    "BLOB": "BLOB",
+}
+
+# Types whose SQL depends on length/precision/scale
+_SIZED_SQL_TYPES: Dict[str, Callable[[Optional[int], Optional[int], Optional[int]], str]] = {
+    "VARCHAR": lambda length, precision, scale: f"VARCHAR({length or 255})",
+    "DECIMAL": lambda length, precision, scale: f"DECIMAL({precision or 18},{scale or 6})",
+}
+
+# Types without a portable spelling; sqlite has no UUID type and no JSON type (TEXT instead)
+_DIALECT_SQL_TYPES: Dict[str, Callable[[str], str]] = {
+    "UUID": lambda dialect_name: "VARCHAR(36)" if dialect_name == "sqlite" else "UUID",
+    "JSON": lambda dialect_name: "JSONB" if dialect_name in ("postgresql", "postgres") else "TEXT",
+}
+
+@lru_cache(maxsize=256)  # pure; many planned columns share a (dataType, length, ...) shape
 def _sql_type_for(meta_dtype: str, length: Optional[int], precision: Optional[int],
                   scale: Optional[int], dialect_name: str) -> str:
     dt = (meta_dtype or "").upper()
-    # Simple, conservative mapping that works across sqlite/pg
-    if dt == "UUID":
-        return "VARCHAR(36)" if dialect_name == "sqlite" else "UUID"
-    if dt == "VARCHAR":
-        return f"VARCHAR({length or 255})"
-    if dt in ("TEXT",):
-        return "TEXT"
-    if dt in ("INTEGER", "BIGINT"):
-        return dt
-    if dt == "DECIMAL":
-        p = precision or 18
-        s = scale or 6
-        return f"DECIMAL({p},{s})"
-    if dt == "FLOAT":
-        return "FLOAT"
-    if dt == "BOOLEAN":
-        return "BOOLEAN"
-    if dt == "DATE":
-        return "DATE"
-    if dt == "TIMESTAMP":
-        # keep generic; engines will map it
-        return "TIMESTAMP"
-    if dt == "JSON":
-        # sqlite has no JSON type; use TEXT
-        return "JSONB" if dialect_name in ("postgresql", "postgres") else "TEXT"
-    if dt == "BLOB":
-        return "BLOB"
+    static = _STATIC_SQL_TYPES.get(dt)
+    if static is not None:
+        return static
+    sized = _SIZED_SQL_TYPES.get(dt)
+    if sized is not None:
+        return sized(length, precision, scale)
+    by_dialect = _DIALECT_SQL_TYPES.get(dt)
+    if by_dialect is not None:
+        return by_dialect(dialect_name)
     return "TEXT"
 
-def _existing_columns_map(engine: Engine) -> Dict[str, Dict[str, str]]:
-    insp = inspect(engine)
-    result: Dict[str, Dict[str, str]] = {}
-    for t in insp.get_table_names():
-        cols = {}
-        for c in insp.get_columns(t):
-            cols[c["name"]] = (str(c.get("type")) or "").upper()
-        result[t] = cols
-    return result
+def _existing_columns_map(
+    engine: Engine, inspector: Optional[Inspector] = None, tables: Optional[Set[str]] = None
+) -> Dict[str, Set[str]]:
+    """
+    {table: {column names}} for the existing tables (only those in `tables` when given),
+    reflected in one batched pass where supported. Presence only: the planner never
+    compares types, so reflected types are not stringified.
+    """
+    if tables is not None and not tables:
+        return {}
+    if inspector is not None:
+        insp = inspector
+        insp.clear_cache()  # reuse the caller's inspector, but never its (possibly stale) results
+    else:
+        insp = inspect(engine)
+    if hasattr(insp, "get_multi_columns"):  # SQLAlchemy 2.x: one catalog query on most dialects
+        multi = insp.get_multi_columns(filter_names=list(tables) if tables is not None else None)
+        by_table = {t: cols for (_schema, t), cols in multi.items()}
+    else:
+        names = insp.get_table_names()
+        by_table = {t: insp.get_columns(t) for t in names if tables is None or t in tables}
+    return {t: {c["name"] for c in cols} for t, cols in by_table.items()}
 
 # ---- planner ----------------------------------------------------------------
 
-def _build_plan(engine: Engine, meta, dialect: str) -> Plan:
+def _build_plan(engine: Engine, meta, dialect: str, inspector: Optional[Inspector] = None) -> Plan:
     """
     meta: engine.meta_models.ModelMeta (pydantic) – already validated in main.py
+    inspector: optional existing Inspector to reflect with (see schema_guard.diff_schema)
     """
     dialect_name = engine.dialect.name
-    existing = _existing_columns_map(engine)
-
-    add_cols: List[AddColumn] = []
-    add_fks: List[AddFK] = []
-
-    for t in meta.tables:
-        tname = t.tableName
-        current_cols = existing.get(tname, {})
-        # columns
-        for col in t.columns:
-            if col.columnName not in current_cols:
-                type_sql = _sql_type_for(
-                    getattr(col.dataType, "value", str(col.dataType)),
-                    getattr(col, "length", None),
-                    getattr(col, "precision", None),
-                    getattr(col, "scale", None),
-                    dialect_name,
-                )
-                add_cols.append(AddColumn(tname, col.columnName, type_sql))
-
-        # FKs
-        for fk in (t.foreignKeys or []):
-            # We cannot reliably introspect “missing fk constraints” on sqlite.
-            # For non-sqlite, we’ll try to add if the column exists (or is planned).
-            add_fks.append(AddFK(tname, fk.columnName, fk.referencedTable, fk.referencedColumn))
-
-    # Keep only FK where the column will exist (already or planned)
-    existing_after_add = {t: set(cols.keys()) for t, cols in _existing_columns_map(engine).items()}
+    existing = _existing_columns_map(engine, inspector, tables={t.tableName for t in meta.tables})
+
+    # columns: each list is built in one pass instead of appended to in nested loops
+    add_cols: List[AddColumn] = [
+        AddColumn(
+            t.tableName,
+            col.columnName,
+            _sql_type_for(
+                _DT.get(col.dataType) or str(col.dataType),
+                col.length,  # both meta representations always define these (default None)
+                col.precision,
+                col.scale,
+                dialect_name,
+            ),
+        )
+        for t in meta.tables
+        for col in t.columns
+        if col.columnName not in existing.get(t.tableName, {})
+    ]
+
+    # FKs: we cannot reliably introspect “missing fk constraints” on sqlite.
+    # For non-sqlite, we’ll try to add if the column exists (or is planned).
+    # Planning changes nothing, so the reflection above is still current; fold the planned
+    # columns into it (add_cols is already built, so it is safe to extend in place).
     for ac in add_cols:
-        existing_after_add.setdefault(ac.table, set()).add(ac.column)
-    add_fks = [fk for fk in add_fks if fk.column in existing_after_add.get(fk.table, set())]
+        existing.setdefault(ac.table, set()).add(ac.column)
+    no_cols: frozenset = frozenset()  # shared miss value; .get(..., set()) built a new set per FK
+    add_fks: List[AddFK] = [
+        AddFK(t.tableName, fk.columnName, fk.referencedTable, fk.referencedColumn)
+        for t in meta.tables
+        for fk in (t.foreignKeys or [])
+        if fk.columnName in existing.get(t.tableName, no_cols)
+    ]
 
     return Plan(add_cols, add_fks)
 
 # ---- applier ----------------------------------------------------------------
 
+def _fk_clause(fk: AddFK, q: Callable[[str], str]) -> str:
+    cname = f'fk_{fk.table}_{fk.column}_{fk.ref_table}_{fk.ref_column}'
+    return (
+        f'ADD CONSTRAINT {q(cname)} FOREIGN KEY ({q(fk.column)}) '
+        f'REFERENCES {q(fk.ref_table)}({q(fk.ref_column)})'
+    )
+
+def _exec_continue(conn, sql: str, what: str, dialect: str) -> None:
+    """Run one DDL statement; log and continue on failure (idempotency / already exists)."""
+    try:
+        if dialect == "postgresql":
+            # a failed statement aborts the whole PG transaction; isolate it in a savepoint
+            with conn.begin_nested():
+                conn.exec_driver_sql(sql)
+        else:
+            conn.exec_driver_sql(sql)
+    except Exception as e:
+        logger.error("%s failed (continuing): %s ; error=%s", what, sql, e)
+
 def apply_additive_changes(engine: Engine, plan: Plan) -> None:
     """
     SQLAlchemy 2.x–compatible apply:
-      - uses engine.begin() and connection.exec_driver_sql()
-      - adds columns
+      - uses one engine.begin() transaction and connection.exec_driver_sql()
+      - adds columns, one ALTER per column so a failing ADD never takes others down with it
       - adds FKs where supported (skips on sqlite with a warning)
     """
     dialect = engine.dialect.name
@@ -129,21 +178,26 @@ def apply_additive_changes(engine: Engine, plan: Plan) -> None:
         logger.info("Nothing to apply.")
         return
 
-    logger.warning("=== APPLY ADDITIVE ===")
-    for ac in plan.add_columns:
-        logger.warning("ADD COLUMN %s.%s %s", ac.table, ac.column, ac.type_sql)
-    for fk in plan.add_fks:
-        logger.warning("ADD FK %s.%s -> %s.%s", fk.table, fk.column, fk.ref_table, fk.ref_column)
+    logger.warning(
+        "=== APPLY ADDITIVE === %d column(s) across %d table(s), %d FK(s)",
+        len(plan.add_columns), len({ac.table for ac in plan.add_columns}), len(plan.add_fks),
+    )
+    # Per-item detail stays at INFO (the default LOG_LEVEL) so the migration is still on record
+    if logger.isEnabledFor(logging.INFO):
+        for ac in plan.add_columns:
+            logger.info("ADD COLUMN %s.%s %s", ac.table, ac.column, ac.type_sql)
+        for fk in plan.add_fks:
+            logger.info("ADD FK %s.%s -> %s.%s", fk.table, fk.column, fk.ref_table, fk.ref_column)
+
+    # Always-quoted identifiers in the dialect's own style (backticks on MySQL), with any
+    # embedded quote characters escaped; type_sql comes from _sql_type_for, never from meta
+    q = engine.dialect.identifier_preparer.quote_identifier
 
     with engine.begin() as conn:
         # Add columns
         for ac in plan.add_columns:
-            sql = f'ALTER TABLE "{ac.table}" ADD COLUMN "{ac.column}" {ac.type_sql}'
-            try:
-                conn.exec_driver_sql(sql)
-            except Exception as e:
-                # idempotency / already exists, or unsupported default/constraint on add
-                logger.error("ADD COLUMN failed (continuing): %s ; error=%s", sql, e)
+            sql = f'ALTER TABLE {q(ac.table)} ADD COLUMN {q(ac.column)} {ac.type_sql}'
+            _exec_continue(conn, sql, "ADD COLUMN", dialect)
 
         # Add FKs (skip on sqlite)
         if dialect == "sqlite":
@@ -153,22 +207,21 @@ def apply_additive_changes(engine: Engine, plan: Plan) -> None:
                     fk.table, fk.column, fk.ref_table, fk.ref_column
                 )
         else:
+            # One statement per FK: the plan lists every meta FK, and an already existing
+            # constraint must only fail its own ALTER
             for fk in plan.add_fks:
-                cname = f'fk_{fk.table}_{fk.column}_{fk.ref_table}_{fk.ref_column}'
-                sql = (
-                    f'ALTER TABLE "{fk.table}" '
-                    f'ADD CONSTRAINT "{cname}" FOREIGN KEY ("{fk.column}") '
-                    f'REFERENCES "{fk.ref_table}"("{fk.ref_column}")'
-                )
-                try:
-                    conn.exec_driver_sql(sql)
-                except Exception as e:
-                    logger.error("ADD FK failed (continuing): %s ; error=%s", sql, e)
+                _exec_continue(conn, f'ALTER TABLE {q(fk.table)} {_fk_clause(fk, q)}', "ADD FK", dialect)
 
 # ---- public entry ------------------------------------------------------------
 
-def plan_and_apply_additive(engine: Engine, meta, dialect: str = "generic", apply: bool = False) -> None:
-    plan = _build_plan(engine, meta, dialect)
+def plan_and_apply_additive(
+    engine: Engine,
+    meta,
+    dialect: str = "generic",
+    apply: bool = False,
+    inspector: Optional[Inspector] = None,
+) -> None:
+    plan = _build_plan(engine, meta, dialect, inspector=inspector)
 
     # Print plan (always)
     print("\n=== META ADDITIVE PLAN ===")
@@ -1,14 +1,16 @@
 # pyright: reportInvalidTypeForm=false
 # engine/routes_base.py
 
+import base64
+import json
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple, Type
+from typing import Any, Dict, List, Optional, Set, Type
 from uuid import UUID, uuid4
 from datetime import datetime
 
 from pydantic import BaseModel
 
-from sqlalchemy import String, Text
+from sqlalchemy import String, Text, and_, or_
 from sqlalchemy import inspect as sa_inspect
 
 logging.basicConfig(level=logging.INFO)
@@ -170,5 +172,74 @@ def _apply_sort(model, sort: Optional[str]):
             order_by.append(col.desc() if desc_ else col.asc())
     return order_by
 
+# -----------------------------------------------------------------------------
+# Keyset (cursor) pagination helpers
+# -----------------------------------------------------------------------------
+def _keyset_columns(model, pk_name: str, sort_name: Optional[str] = None) -> Optional[List[Any]]:
+    """
+    Columns a keyset cursor seeks on: [sort column, PK] or just [PK].
+    None when the sort column is unknown or nullable (NULLs have no portable ordering).
+    """
+    pk_attr = getattr(model, pk_name)
+    if not sort_name or sort_name == pk_name:
+        return [pk_attr]
+    col = model.__table__.columns.get(sort_name)
+    if col is None or col.nullable:
+        return None
+    return [getattr(model, sort_name), pk_attr]
+
+def _keyset_order_by(cols: List[Any], descending: bool) -> List[Any]:
+    return [c.desc() if descending else c.asc() for c in cols]
+
+def _keyset_after(cols: List[Any], values: List[Any], descending: bool):
+    """Rows strictly after `values` in (cols) order; expanded OR form, so no row-value support needed."""
+    clauses = []
+    for i, (col, val) in enumerate(zip(cols, values)):
+        seek = col < val if descending else col > val
+        clauses.append(and_(*[c == v for c, v in zip(cols[:i], values[:i])], seek))
+    return or_(*clauses)
+
+def _encode_cursor(obj, cols: List[Any]) -> str:
+    values = [getattr(obj, c.key) for c in cols]
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _cursor_value(col, value: Any) -> Any:
+    # JSON keeps ints/floats/bools/strings; datetimes, Decimals and UUIDs come back as str
+    if not isinstance(value, (str, int, float)):  # bool is an int; lists/objects/null never bind
+        raise ValueError("cursor values must be scalars")
+    if not isinstance(value, str):
+        return value
+    pytype = _col_python_type(col)
+    if pytype is str or pytype is Any:
+        return value
+    if hasattr(pytype, "fromisoformat"):  # datetime / date / time
+        return pytype.fromisoformat(value)
+    return pytype(value)
+
+def _decode_cursor(cursor: str, cols: List[Any]) -> List[Any]:
+    """Inverse of _encode_cursor; raises ValueError on anything malformed."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception as e:
+        raise ValueError("malformed cursor") from e
+    if not isinstance(values, list) or len(values) != len(cols):
+        raise ValueError("cursor does not match the requested sort")
+    try:
+        return [_cursor_value(c, v) for c, v in zip(cols, values)]
+    except (TypeError, ArithmeticError) as e:  # e.g. decimal.InvalidOperation
+        raise ValueError("cursor value does not match its column") from e
+
 def _serialize_row(obj) -> Dict[str, Any]:
     return {col.name: getattr(obj, col.name) for col in obj.__table__.columns}
+
+def _refresh_and_serialize(db, obj) -> Dict[str, Any]:
+    """
+    Flush, reload what the DB stored (server defaults, DECIMAL scale, tz-aware timestamps),
+    serialize, then commit. Serializing after commit would reload the expired row a second time.
+    """
+    db.flush()
+    db.refresh(obj)
+    item = _serialize_row(obj)
+    db.commit()
+    return item
@@ -2,13 +2,13 @@
 # engine/routes_legacy.py
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, List, Optional, Type
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
-from pydantic import BaseModel, create_model
-from sqlalchemy import asc, desc
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy import asc, desc, func, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from engine.db import get_db
 from .routes_base import (
@@ -24,10 +24,18 @@ from .routes_base import (
     _ensure_from_attributes,
     _clone_model_with_from_attributes,
     _coerce_value,
+    _keyset_columns,
+    _keyset_order_by,
+    _keyset_after,
+    _encode_cursor,
+    _decode_cursor,
 )
 
 logger = logging.getLogger(__name__)
 
+# read_all's own query params; never treated as column filters
+_RESERVED_QUERY_PARAMS = frozenset({"limit", "offset", "sort", "order", "cursor", "with_total"})
+
 def _build_out_model_from_sa(Name: str, Model) -> Type[BaseModel]:
     fields: Dict[str, tuple] = {}
     for col in _sa_cols(Model):
@@ -36,11 +44,15 @@ def _build_out_model_from_sa(Name: str, Model) -> Type[BaseModel]:
             fields[col.name] = (Optional[pytype], None)
         else:
             fields[col.name] = (pytype, ...)
-    Out = create_model(f"{Name.capitalize()}Out", **fields)  # type: ignore
-    Out = _clone_model_with_from_attributes(Out.__name__, Out)
-    if hasattr(Out, "model_rebuild"):
-        Out.model_rebuild()  # type: ignore[attr-defined]
-    return Out
+    name = f"{Name.capitalize()}Out"
+    # from_attributes set at creation: one schema build instead of create_model + a cloned subclass
+    # (same name/doc as the clone produced, so the OpenAPI output is unchanged)
+    return create_model(  # type: ignore
+        name,
+        __config__=ConfigDict(from_attributes=True),
+        __doc__=f"{name} (from_attributes enabled)",
+        **fields,
+    )
 
 def _build_in_model_from_sa(Name: str, Model) -> Type[BaseModel]:
     pk_col, _ = _pk_info(Model)
@@ -75,150 +87,203 @@ def setup_routes(router: APIRouter, models: Dict[str, Any]):
     logger.info("Initializing route setup with SQLAlchemy models: %s", list(sqlalchemy_models.keys()))
 
     for Name, Model in sqlalchemy_models.items():
-        pk_col, pk_pytype = _pk_info(Model)
-
-        InModel: Optional[Type[BaseModel]] = pyd_in.get(Name) or _build_in_model_from_sa(Name, Model)
-        OutModel: Optional[Type[BaseModel]] = pyd_out.get(Name) or _build_out_model_from_sa(Name, Model)
-
-        # Ensure PK is present in Out model
-        def _has_field(model_cls: Type[BaseModel], field_name: str) -> bool:
-            fields = getattr(model_cls, "model_fields", None)
-            if isinstance(fields, dict):
-                return field_name in fields
-            v1_fields = getattr(model_cls, "__fields__", {})
-            return field_name in v1_fields
-
-        if not _has_field(OutModel, pk_col.name):
-            OutModel = create_model(  # type: ignore
-                f"{OutModel.__name__}With{pk_col.name.capitalize()}",
-                **{pk_col.name: (Optional[pk_pytype], None)},
-                __base__=OutModel,
-            )
-            if hasattr(OutModel, "model_rebuild"):
-                OutModel.model_rebuild()  # type: ignore[attr-defined]
-
-        if not _ensure_from_attributes(OutModel):
-            OutModel = _clone_model_with_from_attributes(f"{OutModel.__name__}FromAttrs", OutModel)
-            if hasattr(OutModel, "model_rebuild"):
-                OutModel.model_rebuild()  # type: ignore[attr-defined]
-
-        # closures
-        def make_dep_model(m: Any):
-            def _dep_model() -> Any:
-                return m
-            return _dep_model
-
-        def make_dep_columns(m: Any):
-            cols = {c.name for c in m.__table__.columns}
-            def _dep_columns() -> Set[str]:
-                return cols
-            return _dep_columns
-
-        ListResponseModel = create_model(
-            f"{Name.capitalize()}ListResponse",
-            total=(int, ...),
-            limit=(int, ...),
-            offset=(int, ...),
-            items=(List[OutModel], ...),  # type: ignore[valid-type, reportInvalidTypeForm]
+        _setup_model_routes(router, Name, Model, pyd_in, pyd_out)
+
+
+def _setup_model_routes(router: APIRouter, Name: str, Model: Any, pyd_in: Dict[str, Any], pyd_out: Dict[str, Any]) -> None:
+    """Register one model's CRUD routes; its own scope, so every handler closes over this model."""
+    pk_col, pk_pytype = _pk_info(Model)
+
+    InModel: Optional[Type[BaseModel]] = pyd_in.get(Name) or _build_in_model_from_sa(Name, Model)
+    OutModel: Optional[Type[BaseModel]] = pyd_out.get(Name) or _build_out_model_from_sa(Name, Model)
+
+    # Ensure PK is present in Out model
+    def _has_field(model_cls: Type[BaseModel], field_name: str) -> bool:
+        fields = getattr(model_cls, "model_fields", None)
+        if isinstance(fields, dict):
+            return field_name in fields
+        v1_fields = getattr(model_cls, "__fields__", {})
+        return field_name in v1_fields
+
+    if not _has_field(OutModel, pk_col.name):
+        OutModel = create_model(  # type: ignore
+            f"{OutModel.__name__}With{pk_col.name.capitalize()}",
+            **{pk_col.name: (Optional[pk_pytype], None)},
+            __base__=OutModel,
         )
-        if hasattr(ListResponseModel, "model_rebuild"):
-            ListResponseModel.model_rebuild()  # type: ignore[attr-defined]
-
-        @router.post(f"/{Name}/", response_model=OutModel, tags=[Name], summary=f"Create {Name[:-1] if Name.endswith('s') else Name}")
-        def create_item(
-            payload: InModel = Body(...),  # type: ignore[valid-type, reportInvalidTypeForm]
-            db: Session = Depends(get_db),
-            Model_: Any = Depends(make_dep_model(Model)),
-        ):
-            try:
-                clean = _strip_server_managed(_model_to_dict(payload), [pk_col.name])
-                obj = Model_(**clean)
+        if hasattr(OutModel, "model_rebuild"):
+            OutModel.model_rebuild()  # type: ignore[attr-defined]
+
+    if not _ensure_from_attributes(OutModel):
+        OutModel = _clone_model_with_from_attributes(f"{OutModel.__name__}FromAttrs", OutModel)
+        if hasattr(OutModel, "model_rebuild"):
+            OutModel.model_rebuild()  # type: ignore[attr-defined]
+
+    # column name -> mapped attribute, resolved once per model instead of getattr per request
+    col_attrs: Dict[str, Any] = {c.name: getattr(Model, c.name) for c in Model.__table__.columns}
+    filterable = col_attrs.keys() - _RESERVED_QUERY_PARAMS
+
+    ListResponseModel = create_model(
+        f"{Name.capitalize()}ListResponse",
+        total=(Optional[int], None),  # null when the caller passes with_total=false
+        limit=(int, ...),
+        offset=(int, ...),
+        items=(List[OutModel], ...),  # type: ignore[valid-type, reportInvalidTypeForm]
+        has_more=(bool, ...),
+        next_cursor=(Optional[str], None),
+    )
+    if hasattr(ListResponseModel, "model_rebuild"):
+        ListResponseModel.model_rebuild()  # type: ignore[attr-defined]
+
+    @router.post(f"/{Name}/", response_model=OutModel, tags=[Name], summary=f"Create {Name[:-1] if Name.endswith('s') else Name}")
+    def create_item(
+        payload: InModel = Body(...),  # type: ignore[valid-type, reportInvalidTypeForm]
+        db: Session = Depends(get_db),
+    ):
+        try:
+            clean = _strip_server_managed(_model_to_dict(payload), [pk_col.name])
+            obj = Model(**clean)
+            _apply_server_defaults_on_create(obj)
+            _coerce_uuid_attrs_for_sqlite(obj, db)
+            db.add(obj)
+            db.commit()
+            db.refresh(obj, attribute_names=col_attrs)  # columns only; skips relationship loaders
+            return obj
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+
+    @router.post(f"/{Name}/bulk", response_model=List[OutModel], status_code=201, tags=[Name],  # type: ignore[valid-type]
+                 summary=f"Create many {Name}")
+    def create_items_bulk(
+        payload: List[InModel] = Body(..., max_length=1000),  # type: ignore[valid-type, reportInvalidTypeForm]
+        db: Session = Depends(get_db),
+    ):
+        try:
+            objs = []
+            for item in payload:
+                obj = Model(**_strip_server_managed(_model_to_dict(item), [pk_col.name]))
                 _apply_server_defaults_on_create(obj)
                 _coerce_uuid_attrs_for_sqlite(obj, db)
-                db.add(obj)
-                db.commit()
-                db.refresh(obj)
-                return obj
-            except IntegrityError as e:
-                db.rollback()
-                raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
-
-        @router.get(f"/{Name}/", response_model=ListResponseModel, tags=[Name], summary=f"List {Name}")
-        def read_all(
-            request: Request,
-            sort: Optional[str] = Query(None, description="Column to sort by"),
-            order: str = Query("asc", pattern="^(asc|desc)$"),
-            limit: int = Query(100, ge=1, le=1000),
-            offset: int = Query(0, ge=0),
-            db: Session = Depends(get_db),
-            Model_: Any = Depends(make_dep_model(Model)),
-            column_names_: Set[str] = Depends(make_dep_columns(Model)),
-        ):
-            query = db.query(Model_)
-            reserved = {"limit", "offset", "sort", "order"}
-            for key, value in request.query_params.items():
-                if key in reserved:
-                    continue
-                if key in column_names_:
-                    col = getattr(Model_, key)
-                    query = query.filter(col == _coerce_value(col, value))
-            if sort and sort in column_names_:
-                col = getattr(Model_, sort)
-                query = query.order_by(asc(col) if order == "asc" else desc(col))
-            total = query.count()
-            items = query.offset(offset).limit(limit).all()
-            return {"total": total, "limit": limit, "offset": offset, "items": items}
-
-        @router.get(f"/{Name}/{{item_id}}", response_model=OutModel, tags=[Name], summary=f"Get {Name[:-1] if Name.endswith('s') else Name} by ID")
-        def read_item(item_id: str, db: Session = Depends(get_db), Model_: Any = Depends(make_dep_model(Model))):
-            try:
-                typed_id = pk_pytype(item_id)
-            except Exception:
-                typed_id = item_id
-            obj = db.get(Model_, typed_id)
-            if not obj:
-                raise HTTPException(status_code=404, detail="Item not found")
-            return obj
+                objs.append(obj)
+            db.add_all(objs)
+            db.flush()
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+        if objs:
+            # One SELECT reloads the whole batch (vs. db.refresh per row)
+            pk_attr = col_attrs[pk_col.name]
+            db.execute(
+                select(Model)
+                .where(pk_attr.in_([getattr(o, pk_col.name) for o in objs]))
+                .options(raiseload("*"))
+                .execution_options(populate_existing=True)
+            ).scalars().all()
+        # Build the response before commit, which would expire every row again
+        items = [OutModel.model_validate(o) for o in objs]
+        db.commit()
+        return items
 
-        # One handler for BOTH verbs to avoid 405s
-        @router.api_route(f"/{Name}/{{item_id}}", methods=["PATCH", "PUT"], response_model=OutModel, tags=[Name],
-                          summary=f"Update {Name[:-1] if Name.endswith('s') else Name}")
-        def update_item(
-            item_id: str,
-            payload: InModel = Body(...),  # type: ignore[valid-type, reportInvalidTypeForm]
-            db: Session = Depends(get_db),
-            Model_: Any = Depends(make_dep_model(Model)),
-        ):
+    @router.get(f"/{Name}/", response_model=ListResponseModel, tags=[Name], summary=f"List {Name}")
+    def read_all(
+        request: Request,
+        sort: Optional[str] = Query(None, description="Column to sort by"),
+        order: str = Query("asc", pattern="^(asc|desc)$"),
+        limit: int = Query(100, ge=1, le=1000),
+        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page (same sort/order/filters)"),
+        with_total: bool = Query(True, description="false skips the COUNT(*) query; rely on has_more"),
+        db: Session = Depends(get_db),
+    ):
+        conds = [
+            col_attrs[key] == _coerce_value(col_attrs[key], value)
+            for key, value in request.query_params.items()
+            if key in filterable
+        ]
+        # Responses are built from columns only; raiseload("*") keeps relationship loaders (the v1
+        # models declare lazy="selectin" per FK) from issuing a SELECT per relationship per page
+        stmt = select(Model).where(*conds).options(raiseload("*"))
+        # Keyset pagination: (sort column, PK) when the sort column is non-nullable, else PK only
+        descending = order == "desc"
+        key_cols = None
+        if not sort or sort in col_attrs:
+            key_cols = _keyset_columns(Model, pk_col.name, sort)
+        if key_cols is not None:
+            stmt = stmt.order_by(*_keyset_order_by(key_cols, descending))
+        elif sort and sort in col_attrs:
+            col = col_attrs[sort]
+            stmt = stmt.order_by(asc(col) if order == "asc" else desc(col))
+        total = None
+        if with_total:
+            total = db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one()
+        if cursor:
+            if key_cols is None:
+                raise HTTPException(status_code=400, detail="cursor requires sorting by a non-nullable column")
             try:
-                typed_id = pk_pytype(item_id)
-            except Exception:
-                typed_id = item_id
+                stmt = stmt.where(_keyset_after(key_cols, _decode_cursor(cursor, key_cols), descending))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+            offset = 0  # the cursor already positions the page
+        # One extra row tells whether another page exists without counting the whole set
+        items = db.execute(stmt.offset(offset).limit(limit + 1)).scalars().all()
+        has_more = len(items) > limit
+        items = items[:limit]
+        next_cursor = _encode_cursor(items[-1], key_cols) if key_cols is not None and has_more else None
+        return {
+            "total": total, "limit": limit, "offset": offset, "items": items,
+            "has_more": has_more, "next_cursor": next_cursor,
+        }
 
-            db_obj = db.get(Model_, typed_id)
-            if not db_obj:
-                raise HTTPException(status_code=404, detail="Item not found")
-            try:
-                clean = _strip_server_managed(_model_to_dict(payload), [pk_col.name])
-                for k, v in clean.items():
-                    setattr(db_obj, k, v)
-                _apply_server_defaults_on_update(db_obj)
-                _coerce_uuid_attrs_for_sqlite(db_obj, db)
-                db.commit()
-                db.refresh(db_obj)
-                return db_obj
-            except IntegrityError as e:
-                db.rollback()
-                raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
-
-        @router.delete(f"/{Name}/{{item_id}}", tags=[Name], summary=f"Delete {Name[:-1] if Name.endswith('s') else Name}")
-        def delete_item(item_id: str, db: Session = Depends(get_db), Model_: Any = Depends(make_dep_model(Model))):
-            try:
-                typed_id = pk_pytype(item_id)
-            except Exception:
-                typed_id = item_id
-            db_obj = db.get(Model_, typed_id)
-            if not db_obj:
-                raise HTTPException(status_code=404, detail="Item not found")
-            db.delete(db_obj)
+    @router.get(f"/{Name}/{{item_id}}", response_model=OutModel, tags=[Name], summary=f"Get {Name[:-1] if Name.endswith('s') else Name} by ID")
+    def read_item(item_id: str, db: Session = Depends(get_db)):
+        try:
+            typed_id = pk_pytype(item_id)
+        except Exception:
+            typed_id = item_id
+        obj = db.get(Model, typed_id, options=[raiseload("*")])
+        if not obj:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return obj
+
+    # One handler for BOTH verbs to avoid 405s
+    @router.api_route(f"/{Name}/{{item_id}}", methods=["PATCH", "PUT"], response_model=OutModel, tags=[Name],
+                      summary=f"Update {Name[:-1] if Name.endswith('s') else Name}")
+    def update_item(
+        item_id: str,
+        payload: InModel = Body(...),  # type: ignore[valid-type, reportInvalidTypeForm]
+        db: Session = Depends(get_db),
+    ):
+        try:
+            typed_id = pk_pytype(item_id)
+        except Exception:
+            typed_id = item_id
+
+        db_obj = db.get(Model, typed_id, options=[raiseload("*")])
+        if not db_obj:
+            raise HTTPException(status_code=404, detail="Item not found")
+        try:
+            clean = _strip_server_managed(_model_to_dict(payload), [pk_col.name])
+            for k, v in clean.items():
+                setattr(db_obj, k, v)
+            _apply_server_defaults_on_update(db_obj)
+            _coerce_uuid_attrs_for_sqlite(db_obj, db)
             db.commit()
-            return {"status": "deleted", "id": typed_id}
+            db.refresh(db_obj, attribute_names=col_attrs)
+            return db_obj
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+
+    @router.delete(f"/{Name}/{{item_id}}", tags=[Name], summary=f"Delete {Name[:-1] if Name.endswith('s') else Name}")
+    def delete_item(item_id: str, db: Session = Depends(get_db)):
+        try:
+            typed_id = pk_pytype(item_id)
+        except Exception:
+            typed_id = item_id
+        db_obj = db.get(Model, typed_id)
+        if not db_obj:
+            raise HTTPException(status_code=404, detail="Item not found")
+        db.delete(db_obj)
+        db.commit()
+        return {"status": "deleted", "id": typed_id}
@@ -14,11 +14,11 @@ from datetime import datetime, date
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from pydantic import BaseModel, create_model
 from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from engine.db import get_db
 from .routes_base import (
-    SERVER_MANAGED_FIELDS,
     _is_server_managed,
     _strip_server_managed,
     _apply_server_defaults_on_create,
@@ -26,7 +26,13 @@ from .routes_base import (
     _coerce_uuid_attrs_for_sqlite,
     _string_columns,
     _apply_sort,
+    _keyset_columns,
+    _keyset_order_by,
+    _keyset_after,
+    _encode_cursor,
+    _decode_cursor,
     _serialize_row,
+    _refresh_and_serialize,
 )
 
 try:
@@ -104,7 +110,6 @@ def _make_pydantic_models_from_meta(
         name = col.columnName
         pytype = _sqltype_to_pytype(getattr(col, "dataType", ""))
         is_nullable = bool(getattr(col, "isNullable", False))
-        has_default = getattr(col, "defaultValue", None) is not None
 
         # READ model: include everything; make nullable fields Optional
         read_ann = Optional[pytype] if is_nullable else pytype
@@ -131,10 +136,12 @@ def _make_pydantic_models_from_meta(
     ListModel   = create_model(
         f"{base}ListResponse",
         __base__=BaseModel,
-        total=(int, ...),
+        total=(Optional[int], None),  # omitted when the caller passes with_total=false
         limit=(int, ...),
         offset=(int, ...),
         items=(List[ReadModel], ...),
+        has_more=(bool, ...),
+        next_cursor=(Optional[str], None),
     )
 
     # pydantic v2: ensure models are fully built
@@ -160,6 +167,7 @@ def build_crud_router(entity: Table, model, meta: ModelMeta) -> APIRouter:
         return router
 
     CreateModel, ReadModel, UpdateModel, ListResponseModel = _make_pydantic_models_from_meta(entity)
+    string_cols = _string_columns(model)  # fixed per model; the ?q= search reuses it on every request
 
     # -------- LIST
     @router.get(
@@ -173,21 +181,53 @@ def build_crud_router(entity: Table, model, meta: ModelMeta) -> APIRouter:
         offset: int = Query(0, ge=0),
         sort: Optional[str] = Query(None, description="e.g. -created_at,name"),
         q: Optional[str] = Query(None, description="basic text search across string columns"),
+        cursor: Optional[str] = Query(
+            None,
+            description="next_cursor from the previous page (same sort/q); seeks instead of using offset",
+        ),
+        with_total: bool = Query(True, description="false skips the COUNT(*) query; rely on has_more"),
     ):
         stmt = select(model)
         if q:
-            ors = [c.ilike(f"%{q}%") for c in _string_columns(model)]
+            ors = [c.ilike(f"%{q}%") for c in string_cols]
             if ors:
                 from sqlalchemy import or_ as _or
                 stmt = stmt.where(_or(*ors))
-        order_by = _apply_sort(model, sort)
-        if order_by:
-            stmt = stmt.order_by(*order_by)
 
-        total = db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one()
-        rows = db.execute(stmt.limit(limit).offset(offset)).scalars().all()
+        # Keyset pagination needs a total order: no sort or one non-nullable column, PK as tiebreaker
+        fields = [f.strip() for f in (sort or "").split(",") if f.strip()]
+        descending = len(fields) == 1 and fields[0].startswith("-")
+        key_cols = None
+        if len(fields) <= 1:
+            key_cols = _keyset_columns(model, pk[0], fields[0].lstrip("-") if fields else None)
+        if key_cols is not None:
+            stmt = stmt.order_by(*_keyset_order_by(key_cols, descending))
+        else:
+            order_by = _apply_sort(model, sort)
+            if order_by:
+                stmt = stmt.order_by(*order_by)
+
+        total = None
+        if with_total:
+            total = db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one()
+        if cursor:
+            if key_cols is None:
+                raise HTTPException(status_code=400, detail="cursor requires no sort or a single non-nullable sort column")
+            try:
+                stmt = stmt.where(_keyset_after(key_cols, _decode_cursor(cursor, key_cols), descending))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+            offset = 0  # the cursor already positions the page
+        # One extra row tells whether another page exists without counting the whole set
+        rows = db.execute(stmt.limit(limit + 1).offset(offset)).scalars().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
         items = [_serialize_row(r) for r in rows]
-        return {"total": total, "limit": limit, "offset": offset, "items": items}
+        next_cursor = _encode_cursor(rows[-1], key_cols) if key_cols is not None and has_more else None
+        return {
+            "total": total, "limit": limit, "offset": offset, "items": items,
+            "has_more": has_more, "next_cursor": next_cursor,
+        }
 
     # -------- GET
     @router.get(
@@ -209,10 +249,37 @@ def build_crud_router(entity: Table, model, meta: ModelMeta) -> APIRouter:
         _apply_server_defaults_on_create(obj)
         _coerce_uuid_attrs_for_sqlite(obj, db)
         db.add(obj)
-        db.flush()
-        db.refresh(obj)
+        return _refresh_and_serialize(db, obj)
+
+    # -------- BULK CREATE (POST /bulk): one flush + one commit for the whole batch
+    @router.post("/bulk", response_model=List[ReadModel], status_code=201)
+    def create_items_bulk(
+        payload: List[CreateModel] = Body(..., max_length=1000),  # type: ignore[reportInvalidTypeForm]
+        db: Session = Depends(get_db),
+    ):
+        objs = []
+        for item in payload:
+            obj = model(**_strip_server_managed(item.model_dump(exclude_unset=True), pk))
+            _apply_server_defaults_on_create(obj)
+            _coerce_uuid_attrs_for_sqlite(obj, db)
+            objs.append(obj)
+        try:
+            db.add_all(objs)
+            db.flush()
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+        if objs:
+            # Reload DB-side defaults for the whole batch in one SELECT instead of a refresh per row
+            pk_attr = getattr(model, pk[0])
+            db.execute(
+                select(model)
+                .where(pk_attr.in_([getattr(o, pk[0]) for o in objs]))
+                .execution_options(populate_existing=True)
+            ).scalars().all()
+        items = [_serialize_row(o) for o in objs]  # before commit, which would expire them
         db.commit()
-        return _serialize_row(obj)
+        return items
 
     # -------- UPDATE (PATCH): separate route to avoid duplicate operationIds
     @router.patch(
@@ -234,10 +301,7 @@ def build_crud_router(entity: Table, model, meta: ModelMeta) -> APIRouter:
                 setattr(obj, k, v)
         _apply_server_defaults_on_update(obj)
         _coerce_uuid_attrs_for_sqlite(obj, db)
-        db.flush()
-        db.refresh(obj)
-        db.commit()
-        return _serialize_row(obj)
+        return _refresh_and_serialize(db, obj)
 
     # -------- REPLACE (PUT): separate route with its own name/operationId
     @router.put(
@@ -260,10 +324,7 @@ def build_crud_router(entity: Table, model, meta: ModelMeta) -> APIRouter:
                 setattr(obj, k, v)
         _apply_server_defaults_on_update(obj)
         _coerce_uuid_attrs_for_sqlite(obj, db)
-        db.flush()
-        db.refresh(obj)
-        db.commit()
-        return _serialize_row(obj)
+        return _refresh_and_serialize(db, obj)
 
     # -------- DELETE
     @router.delete("/{item_id}", status_code=204)
@@ -1,8 +1,9 @@
 # engine/schema_guard.py
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional
 from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import Inspector
 from engine.meta_models import ModelMeta
 
 @dataclass
@@ -27,14 +28,19 @@ class SchemaDiff:
                     lines.append(f"  - {t}.{c}")
         return "\n".join(lines) if lines else "No schema differences detected."
 
-def diff_schema(engine, meta: ModelMeta) -> SchemaDiff:
+def diff_schema(engine, meta: ModelMeta, inspector: Optional[Inspector] = None) -> SchemaDiff:
     """
     Compare actual DB schema with ModelMeta (additive-only check):
       - tables in meta that don't exist in DB
       - columns in meta missing from DB tables
     (We don't enforce types/FKs here to keep this safe & additive.)
+    Pass an existing `inspector` to reuse it instead of building a new one.
     """
-    insp = sa_inspect(engine)
+    if inspector is not None:
+        insp = inspector
+        insp.clear_cache()  # reflection is cached per inspector; the schema may have changed since
+    else:
+        insp = sa_inspect(engine)
     existing_tables = set(insp.get_table_names())
     diff = SchemaDiff()
 
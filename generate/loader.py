@@ -4,9 +4,24 @@ from pathlib import Path
 from jsonschema import ValidationError
 from jsonschema.validators import Draft7Validator
 
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
 class InvalidSchemaError(Exception):
     pass
 
+def _load_json(path: Path):
+    """Parse a JSON file: msgspec's C decoder when installed, stdlib json otherwise."""
+    raw = path.read_bytes()
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.MsgspecError:
+            pass  # let stdlib decide (it accepts NaN/Infinity) and raise its usual error
+    return json.loads(raw.decode("utf-8"))
+
 def _resolve_spec_path(spec_uri: str | None) -> Path:
     """
     Resolve the JSON-Schema file path from a $schema URI/path with fallbacks.
@@ -36,13 +51,13 @@ def load_schema(path: str = "schema.json") -> dict:
     if not meta_path.exists():
         raise InvalidSchemaError(f"Schema file not found at {path}")
 
-    data = json.loads(meta_path.read_text(encoding="utf-8"))
+    data = _load_json(meta_path)
 
     # Resolve the spec from the metadata's $schema (preferred) or fallbacks
     spec_path = _resolve_spec_path(data.get("$schema"))
 
     try:
-        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+        spec = _load_json(spec_path)
     except Exception as e:
         raise InvalidSchemaError(f"Failed to read spec at {spec_path}: {e}") from e
 
@@ -3,3 +3,55 @@ import os, sys
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+import pytest
+
+
+@pytest.fixture
+def make_client():
+    """
+    make_client(models, meta=None) -> TestClient on a fresh in-memory SQLite DB.
+    With `meta` the app serves the meta-driven routes (engine.routes_meta), without it
+    the legacy routes (engine.routes_legacy) for the same models.
+    client.statements collects every SQL statement sent to the DB (clear it before a request).
+    """
+    from fastapi import APIRouter, FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from engine.db import get_db
+    from engine.routes import build_crud_router, setup_routes
+
+    def _make(models, meta=None):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        for model in models.values():
+            model.__table__.create(bind=engine)
+        SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+        def _get_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = FastAPI()
+        if meta is not None:
+            for table in meta.tables:
+                app.include_router(build_crud_router(table, models[table.tableName], meta))
+        else:
+            router = APIRouter()
+            setup_routes(router, {"sqlalchemy_models": models})
+            app.include_router(router)
+        app.dependency_overrides[get_db] = _get_db
+        client = TestClient(app)
+        client.statements = []
+        event.listen(
+            engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: client.statements.append(statement),
+        )
+        return client
+
+    return _make
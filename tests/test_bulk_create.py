@@ -0,0 +1,60 @@
+import pytest
+
+from engine.ddl_builder import build_models_from_meta
+from engine.meta_models import ModelMeta
+
+META = ModelMeta.model_validate({"tables": [{
+    "tableName": "bk_items",
+    "columns": [
+        {"columnName": "id", "dataType": "UUID"},
+        {"columnName": "code", "dataType": "VARCHAR", "length": 20, "isUnique": True},
+        {"columnName": "qty", "dataType": "INTEGER"},
+        {"columnName": "created_at", "dataType": "TIMESTAMP", "isNullable": True, "defaultValue": "now"},
+    ],
+    "primaryKey": ["id"],
+}]})
+
+
+@pytest.fixture(scope="module")
+def models():
+    return build_models_from_meta(META, dialect="sqlite")
+
+
+@pytest.fixture(params=["meta", "legacy"])
+def client(request, models, make_client):
+    return make_client(models, META if request.param == "meta" else None)
+
+
+def _total(client):
+    return client.get("/bk_items/").json()["total"]
+
+
+def test_bulk_create(client):
+    r = client.post("/bk_items/bulk", json=[{"code": f"c{i}", "qty": i} for i in range(3)])
+    assert r.status_code == 201
+    items = r.json()
+    assert [(it["code"], it["qty"]) for it in items] == [("c0", 0), ("c1", 1), ("c2", 2)]
+    assert len({it["id"] for it in items}) == 3 and all(it["created_at"] for it in items)
+    assert _total(client) == 3
+    assert client.post("/bk_items/bulk", json=[]).json() == []
+
+
+def test_bulk_create_limit(client):
+    r = client.post("/bk_items/bulk", json=[{"code": f"c{i}", "qty": i} for i in range(1001)])
+    assert r.status_code == 422
+    assert _total(client) == 0
+
+
+def test_bulk_create_rolls_back_on_integrity_error(client):
+    assert client.post("/bk_items/bulk", json=[{"code": "dup", "qty": 1}]).status_code == 201
+    r = client.post("/bk_items/bulk", json=[{"code": "new", "qty": 2}, {"code": "dup", "qty": 3}])
+    assert r.status_code == 400 and r.json()["detail"].startswith("Database error:")
+    assert _total(client) == 1  # "new" was not kept either
+
+
+def test_bulk_create_reloads_batch_in_one_select(client):
+    client.statements.clear()
+    r = client.post("/bk_items/bulk", json=[{"code": f"c{i}", "qty": i} for i in range(20)])
+    assert r.status_code == 201 and len(r.json()) == 20
+    selects = [s for s in client.statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1, selects
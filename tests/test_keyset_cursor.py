@@ -0,0 +1,115 @@
+import base64
+import json
+
+import pytest
+
+from engine.ddl_builder import build_models_from_meta
+from engine.meta_models import ModelMeta
+from engine.routes_base import _decode_cursor, _encode_cursor, _keyset_columns
+
+META = ModelMeta.model_validate({"tables": [{
+    "tableName": "kc_items",
+    "columns": [
+        {"columnName": "id", "dataType": "UUID"},
+        {"columnName": "rank", "dataType": "INTEGER"},
+        {"columnName": "label", "dataType": "VARCHAR", "length": 20, "isNullable": True},
+    ],
+    "primaryKey": ["id"],
+}]})
+
+
+@pytest.fixture(scope="module")
+def models():
+    return build_models_from_meta(META, dialect="sqlite")
+
+
+@pytest.fixture
+def client(models, make_client):
+    c = make_client(models, META)
+    for i in range(11):
+        # ranks 0..3 repeat, so sorting by rank needs the PK tiebreaker
+        assert c.post("/kc_items/", json={"rank": i % 4, "label": f"l{i}"}).status_code == 201
+    return c
+
+
+def _cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def _walk(client, params):
+    pages, cursor = [], None
+    while True:
+        j = client.get("/kc_items/", params={**params, **({"cursor": cursor} if cursor else {})}).json()
+        pages.append(j)
+        cursor = j.get("next_cursor")  # null fields are left out of meta list responses
+        if cursor is None:
+            return pages
+
+
+def test_keyset_columns(models):
+    Model = models["kc_items"]
+    assert _keyset_columns(Model, "id") == [Model.id]
+    assert _keyset_columns(Model, "id", "rank") == [Model.rank, Model.id]
+    assert _keyset_columns(Model, "id", "label") is None  # nullable
+    assert _keyset_columns(Model, "id", "nope") is None
+
+
+def test_cursor_round_trip(models):
+    Model = models["kc_items"]
+    cols = [Model.rank, Model.id]
+    row = Model(id="a1", rank=3)
+    assert _decode_cursor(_encode_cursor(row, cols), cols) == [3, "a1"]
+
+
+@pytest.mark.parametrize("values", [[[], "a"], [{"x": 1}, "a"], [None, "a"], [1]])
+def test_decode_cursor_rejects_bad_values(models, values):
+    Model = models["kc_items"]
+    with pytest.raises(ValueError):
+        _decode_cursor(_cursor(values), [Model.rank, Model.id])
+
+
+@pytest.mark.parametrize("sort", [None, "id", "-id", "rank", "-rank"])
+def test_cursor_walk_matches_full_listing(client, sort):
+    params = {"sort": sort} if sort else {}
+    pages = _walk(client, {**params, "limit": 3})
+    walked = [it["id"] for p in pages for it in p["items"]]
+    full = [it["id"] for it in client.get("/kc_items/", params={**params, "limit": 100}).json()["items"]]
+    assert walked == full and len(set(walked)) == 11
+    assert [p["has_more"] for p in pages] == [True, True, True, False]
+    ranks = [it["rank"] for p in pages for it in p["items"]]
+    if sort in ("rank", "-rank"):
+        assert ranks == sorted(ranks, reverse=sort == "-rank")
+
+
+def test_without_total(client):
+    j = client.get("/kc_items/", params={"limit": 10, "with_total": "false"}).json()
+    assert "total" not in j and j["has_more"] is True and len(j["items"]) == 10
+    j = client.get("/kc_items/", params={"limit": 11}).json()
+    assert j["total"] == 11 and j["has_more"] is False and "next_cursor" not in j
+
+
+@pytest.mark.parametrize("cursor", ["garbage!!", _cursor([1, 2]), _cursor([[]]), _cursor([{"a": 1}])])
+def test_invalid_cursor_is_400(client, cursor):
+    assert client.get("/kc_items/", params={"cursor": cursor}).status_code == 400
+
+
+def test_cursor_needs_orderable_sort(client):
+    r = client.get("/kc_items/", params={"sort": "label", "cursor": _cursor(["l1", "x"])})
+    assert r.status_code == 400
+
+
+def test_legacy_cursor_walk(models, make_client):
+    c = make_client(models)
+    for i in range(7):
+        assert c.post("/kc_items/", json={"rank": i % 2, "label": None}).status_code < 300
+    for params in ({}, {"sort": "rank"}, {"sort": "rank", "order": "desc"}):
+        seen, cursor = [], None
+        while True:
+            j = c.get("/kc_items/", params={**params, "limit": 3, **({"cursor": cursor} if cursor else {})}).json()
+            seen += [it["id"] for it in j["items"]]
+            cursor = j.get("next_cursor")
+            if cursor is None:
+                break
+        full = [it["id"] for it in c.get("/kc_items/", params={**params, "limit": 100}).json()["items"]]
+        assert seen == full and len(set(seen)) == 7
+    assert c.get("/kc_items/", params={"cursor": _cursor([[]])}).status_code == 400
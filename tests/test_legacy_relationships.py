@@ -0,0 +1,48 @@
+from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Parents(_Base):
+    __tablename__ = "rel_parents"
+    id = Column(String(36), primary_key=True)
+    name = Column(String(20))
+
+
+class Kids(_Base):
+    __tablename__ = "rel_kids"
+    id = Column(String(36), primary_key=True)
+    parent_id = Column(String(36), ForeignKey("rel_parents.id"))
+    name = Column(String(20))
+    # Same shape as generate/models.py: one selectin relationship per FK
+    parent = relationship(Parents, foreign_keys=[parent_id], lazy="selectin")
+
+
+def _selects(client):
+    return [s for s in client.statements if s.lstrip().upper().startswith("SELECT")]
+
+
+def test_legacy_routes_skip_relationship_loaders(make_client):
+    c = make_client({"rel_parents": Parents, "rel_kids": Kids})
+    parent_id = c.post("/rel_parents/", json={"name": "p"}).json()["id"]
+
+    def count(method, url, **kw):
+        c.statements.clear()
+        r = c.request(method, url, **kw)
+        assert r.status_code < 300, r.text
+        return r.json(), len(_selects(c))
+
+    kid, n = count("POST", "/rel_kids/", json={"parent_id": parent_id, "name": "k0"})
+    assert n == 1  # refresh of the new row only
+    _, n = count("POST", "/rel_kids/bulk", json=[{"parent_id": parent_id, "name": f"k{i}"} for i in range(1, 4)])
+    assert n == 1
+    body, n = count("GET", "/rel_kids/")
+    assert body["total"] == 4 and n == 2  # COUNT + page
+    _, n = count("GET", f"/rel_kids/{kid['id']}")
+    assert n == 1
+    body, n = count("PATCH", f"/rel_kids/{kid['id']}", json={"parent_id": parent_id, "name": "renamed"})
+    assert body["name"] == "renamed" and n == 2  # get + refresh
+    assert "parent" not in body